@@ -0,0 +1,23 @@
+"""Shared Rich console for ezBIDS CLI."""
+
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@lru_cache(maxsize=1)
+def get_console() -> "Console":
+    """
+    Return the shared console, creating it on first use.
+
+    When stdout is not a terminal (e.g. output captured to a log), syntax
+    highlighting and emoji codes are disabled. Markup is still parsed so
+    style tags never leak into the output.
+    """
+    from rich.console import Console
+
+    interactive = sys.stdout.isatty()
+    return Console(highlight=interactive, emoji=interactive)
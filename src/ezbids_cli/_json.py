@@ -0,0 +1,136 @@
+"""JSON helpers for ezBIDS CLI.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise.
+"""
+
+import json
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if orjson is not None
+    else 0
+)
+
+
+def dumps_json(obj: Any, default: Callable[[Any], Any] | None = None) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON indented by two spaces.
+
+    Parameters
+    ----------
+    obj : Any
+        JSON-serializable object
+    default : callable, optional
+        Called for objects that are not natively serializable
+
+    Returns
+    -------
+    bytes
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, indent=2, default=default).encode("utf-8")
+
+
+def dump_json(
+    obj: Any,
+    path: Path | str,
+    default: Callable[[Any], Any] | None = None,
+) -> None:
+    """
+    Write obj to path as JSON indented by two spaces.
+
+    Parameters
+    ----------
+    obj : Any
+        JSON-serializable object
+    path : Path or str
+        Output file path
+    default : callable, optional
+        Called for objects that are not natively serializable
+    """
+    with open(path, "wb") as f:
+        f.write(dumps_json(obj, default=default))
+
+
+def stream_json(
+    obj: dict[str, Any],
+    path: Path | str,
+    default: Callable[[Any], Any] | None = None,
+) -> None:
+    """
+    Write a JSON object to path, serializing its top-level arrays element by element.
+
+    The output is identical to ``dump_json``, but large arrays (and
+    iterators, which are written as arrays) are never held in memory as one
+    encoded document.
+
+    Parameters
+    ----------
+    obj : dict[str, Any]
+        JSON-serializable mapping with string keys
+    path : Path or str
+        Output file path
+    default : callable, optional
+        Called for objects that are not natively serializable
+    """
+    with open(path, "wb") as f:
+        if not obj:
+            f.write(b"{}")
+            return
+
+        for i, (key, value) in enumerate(obj.items()):
+            f.write(b",\n  " if i else b"{\n  ")
+            f.write(dumps_json(key) + b": ")
+
+            if not isinstance(value, (list, tuple, Iterator)):
+                f.write(dumps_json(value, default=default).replace(b"\n", b"\n  "))
+                continue
+
+            empty = True
+            for element in value:
+                f.write(b"[\n    " if empty else b",\n    ")
+                f.write(dumps_json(element, default=default).replace(b"\n", b"\n    "))
+                empty = False
+            f.write(b"[]" if empty else b"\n  ]")
+
+        f.write(b"\n}")
+
+
+def load_json(path: Path | str) -> Any:
+    """
+    Read and parse a JSON file.
+
+    Documents orjson rejects but the standard library accepts (NaN,
+    Infinity, integers wider than 64 bits) are parsed with the standard
+    library.
+
+    Parameters
+    ----------
+    path : Path or str
+        Input file path
+
+    Returns
+    -------
+    Any
+        Parsed JSON document
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
@@ -1,17 +1,64 @@
 """CLI entry point for ezBIDS."""
 
-from pathlib import Path
+import importlib
 from typing import Optional
 
 import click
-from rich.console import Console
 
 from ezbids_cli import __version__
 
-console = Console()
 
+class LazyGroup(click.Group):
+    """
+    Click group that imports subcommand modules only when invoked.
+
+    Help listings use the static summaries below, so ``ezbids --help``
+    imports no subcommand module; keep them in sync with the commands'
+    docstrings.
+    """
 
-@click.group()
+    COMMANDS = {
+        "analyze": "ezbids_cli.cli_cmds.analyze:cmd",
+        "convert": "ezbids_cli.cli_cmds.convert:cmd",
+        "review": "ezbids_cli.cli_cmds.review:cmd",
+        "apply": "ezbids_cli.cli_cmds.apply:cmd",
+        "init-config": "ezbids_cli.cli_cmds.init_config:cmd",
+        "validate": "ezbids_cli.cli_cmds.validate:cmd",
+    }
+
+    SHORT_HELP = {
+        "analyze": "Analyze DICOM/NIfTI data and generate BIDS mapping.",
+        "convert": "Convert DICOM/NIfTI data to BIDS format.",
+        "review": "Launch interactive TUI to review and edit BIDS mappings.",
+        "apply": "Apply finalized BIDS mappings to create dataset.",
+        "init-config": "Generate a configuration template from analyzed data.",
+        "validate": "Run BIDS validator on a dataset.",
+    }
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Return the names of all subcommands."""
+        return sorted(self.COMMANDS)
+
+    def get_command(self, ctx: click.Context, name: str) -> Optional[click.Command]:
+        """Import and return the named subcommand."""
+        target = self.COMMANDS.get(name)
+        if target is None:
+            return None
+        module_name, attr = target.split(":")
+        command = getattr(importlib.import_module(module_name), attr)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{target} is not a click command")
+        return command
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """Write the command list from the static summaries."""
+        rows = [(name, self.SHORT_HELP[name]) for name in self.list_commands(ctx)]
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
+@click.group(cls=LazyGroup)
 @click.version_option(version=__version__, prog_name="ezbids")
 @click.option("-v", "--verbose", count=True, help="Increase verbosity")
 @click.pass_context
@@ -21,229 +68,5 @@ def main(ctx: click.Context, verbose: int) -> None:
     ctx.obj["verbose"] = verbose
 
 
-@main.command()
-@click.argument("input_dir", type=click.Path(exists=True, file_okay=False, path_type=Path))
-@click.option(
-    "-o",
-    "--output-dir",
-    type=click.Path(file_okay=False, path_type=Path),
-    help="Output directory for analysis results",
-)
-@click.option(
-    "-c",
-    "--config",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
-    help="Configuration file (YAML)",
-)
-@click.pass_context
-def analyze(
-    ctx: click.Context,
-    input_dir: Path,
-    output_dir: Optional[Path],
-    config: Optional[Path],
-) -> None:
-    """Analyze DICOM/NIfTI data and generate BIDS mapping.
-
-    INPUT_DIR is the directory containing DICOM or NIfTI files.
-    """
-    from ezbids_cli.core.analyzer import Analyzer
-
-    if output_dir is None:
-        output_dir = input_dir / "ezbids_work"
-
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    console.print(f"[bold blue]Analyzing:[/] {input_dir}")
-    console.print(f"[bold blue]Output:[/] {output_dir}")
-
-    analyzer = Analyzer(input_dir, output_dir, config_path=config)
-    result = analyzer.analyze()
-
-    output_file = output_dir / "ezBIDS_core.json"
-    console.print(f"[bold green]Analysis complete:[/] {output_file}")
-
-
-@main.command()
-@click.argument("input_dir", type=click.Path(exists=True, file_okay=False, path_type=Path))
-@click.option(
-    "-o",
-    "--output-dir",
-    type=click.Path(file_okay=False, path_type=Path),
-    required=True,
-    help="Output directory for BIDS dataset",
-)
-@click.option(
-    "-c",
-    "--config",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
-    help="Configuration file (YAML)",
-)
-@click.option(
-    "--link-mode",
-    type=click.Choice(["hardlink", "symlink", "copy"]),
-    default="hardlink",
-    help="File linking strategy",
-)
-@click.option("--skip-validation", is_flag=True, help="Skip BIDS validation")
-@click.pass_context
-def convert(
-    ctx: click.Context,
-    input_dir: Path,
-    output_dir: Path,
-    config: Optional[Path],
-    link_mode: str,
-    skip_validation: bool,
-) -> None:
-    """Convert DICOM/NIfTI data to BIDS format.
-
-    INPUT_DIR is the directory containing DICOM or NIfTI files.
-    """
-    from ezbids_cli.core.analyzer import Analyzer
-    from ezbids_cli.convert.converter import BIDSConverter
-
-    work_dir = output_dir / ".ezbids_work"
-    work_dir.mkdir(parents=True, exist_ok=True)
-
-    console.print(f"[bold blue]Converting:[/] {input_dir}")
-    console.print(f"[bold blue]Output:[/] {output_dir}")
-
-    # Step 1: Analyze
-    console.print("[bold]Step 1/2:[/] Analyzing data...")
-    analyzer = Analyzer(input_dir, work_dir, config_path=config)
-    analysis_result = analyzer.analyze()
-
-    # Step 2: Convert
-    console.print("[bold]Step 2/2:[/] Converting to BIDS...")
-    converter = BIDSConverter(
-        analysis_result,
-        output_dir,
-        link_mode=link_mode,
-    )
-    converter.convert()
-
-    if not skip_validation:
-        console.print("[bold]Validating BIDS output...")
-        from ezbids_cli.validation.validator import print_validation_result, validate_dataset
-
-        bids_dataset_dir = output_dir / "dataset"
-        if bids_dataset_dir.exists():
-            result = validate_dataset(bids_dataset_dir)
-        else:
-            result = validate_dataset(output_dir)
-        print_validation_result(result, verbose=ctx.obj.get("verbose", 0) > 0)
-
-    console.print(f"[bold green]Conversion complete:[/] {output_dir}")
-
-
-@main.command()
-@click.argument("analysis_file", type=click.Path(exists=True, dir_okay=False, path_type=Path))
-@click.option(
-    "-c",
-    "--config",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
-    help="Configuration file (YAML)",
-)
-@click.pass_context
-def review(
-    ctx: click.Context,
-    analysis_file: Path,
-    config: Optional[Path],
-) -> None:
-    """Launch interactive TUI to review and edit BIDS mappings.
-
-    ANALYSIS_FILE is the ezBIDS_core.json file from the analyze command.
-    """
-    from ezbids_cli.tui.app import EzbidsTUI
-
-    app = EzbidsTUI(analysis_file, config_path=config)
-    app.run()
-
-
-@main.command()
-@click.argument("finalized_file", type=click.Path(exists=True, dir_okay=False, path_type=Path))
-@click.argument("output_dir", type=click.Path(file_okay=False, path_type=Path))
-@click.option(
-    "--link-mode",
-    type=click.Choice(["hardlink", "symlink", "copy"]),
-    default="hardlink",
-    help="File linking strategy",
-)
-@click.pass_context
-def apply(
-    ctx: click.Context,
-    finalized_file: Path,
-    output_dir: Path,
-    link_mode: str,
-) -> None:
-    """Apply finalized BIDS mappings to create dataset.
-
-    FINALIZED_FILE is the finalized.json file from the review command.
-    OUTPUT_DIR is the directory where the BIDS dataset will be created.
-    """
-    import json
-
-    from ezbids_cli.convert.converter import BIDSConverter
-
-    console.print(f"[bold blue]Applying:[/] {finalized_file}")
-    console.print(f"[bold blue]Output:[/] {output_dir}")
-
-    with open(finalized_file) as f:
-        data = json.load(f)
-
-    converter = BIDSConverter(data, output_dir, link_mode=link_mode)
-    converter.convert()
-
-    console.print(f"[bold green]BIDS dataset created:[/] {output_dir}")
-
-
-@main.command("init-config")
-@click.argument("input_dir", type=click.Path(exists=True, file_okay=False, path_type=Path))
-@click.option(
-    "-o",
-    "--output",
-    type=click.Path(dir_okay=False, path_type=Path),
-    default=Path("ezbids_config.yaml"),
-    help="Output config file",
-)
-@click.pass_context
-def init_config(
-    ctx: click.Context,
-    input_dir: Path,
-    output: Path,
-) -> None:
-    """Generate a configuration template from analyzed data.
-
-    INPUT_DIR is the directory containing DICOM or NIfTI files.
-    """
-    from ezbids_cli.config.exporter import export_config
-    from ezbids_cli.core.analyzer import Analyzer
-
-    console.print(f"[bold blue]Analyzing:[/] {input_dir}")
-
-    work_dir = input_dir / ".ezbids_work"
-    work_dir.mkdir(parents=True, exist_ok=True)
-
-    analyzer = Analyzer(input_dir, work_dir)
-    analysis_result = analyzer.analyze()
-
-    export_config(analysis_result, output)
-    console.print(f"[bold green]Config template created:[/] {output}")
-
-
-@main.command()
-@click.argument("bids_dir", type=click.Path(exists=True, file_okay=False, path_type=Path))
-@click.pass_context
-def validate(ctx: click.Context, bids_dir: Path) -> None:
-    """Run BIDS validator on a dataset.
-
-    BIDS_DIR is the root directory of the BIDS dataset.
-    """
-    from ezbids_cli.validation.validator import print_validation_result, validate_dataset
-
-    console.print(f"[bold blue]Validating:[/] {bids_dir}")
-    result = validate_dataset(bids_dir)
-    print_validation_result(result, verbose=ctx.obj.get("verbose", 0) > 0)
-
-
 if __name__ == "__main__":
     main()
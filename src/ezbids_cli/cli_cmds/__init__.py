@@ -0,0 +1,5 @@
+"""Subcommand implementations for the ezBIDS CLI.
+
+Each module defines a single Click command named ``cmd``. Modules are
+imported on demand by :class:`ezbids_cli.cli.LazyGroup`.
+"""
@@ -0,0 +1,31 @@
+"""Parameter types and options shared by the ezBIDS subcommands."""
+
+from pathlib import Path
+
+import click
+
+EXISTING_DIR = click.Path(exists=True, file_okay=False, path_type=Path)
+EXISTING_FILE = click.Path(exists=True, dir_okay=False, path_type=Path)
+OUTPUT_DIR = click.Path(file_okay=False, path_type=Path)
+
+config_option = click.option(
+    "-c",
+    "--config",
+    type=EXISTING_FILE,
+    help="Configuration file (YAML)",
+)
+
+link_mode_option = click.option(
+    "--link-mode",
+    type=click.Choice(["hardlink", "symlink", "copy"]),
+    default="hardlink",
+    help="File linking strategy",
+)
+
+jobs_option = click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of parallel file operations (default: number of CPUs)",
+)
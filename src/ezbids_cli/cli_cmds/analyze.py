@@ -0,0 +1,50 @@
+"""``ezbids analyze`` command."""
+
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from ezbids_cli._console import get_console
+from ezbids_cli.cli_cmds._options import EXISTING_DIR, OUTPUT_DIR, config_option, jobs_option
+
+
+@click.command("analyze")
+@click.argument("input_dir", type=EXISTING_DIR)
+@click.option(
+    "-o",
+    "--output-dir",
+    type=OUTPUT_DIR,
+    help="Output directory for analysis results",
+)
+@config_option
+@jobs_option
+@click.pass_context
+def cmd(
+    ctx: click.Context,
+    input_dir: Path,
+    output_dir: Optional[Path],
+    config: Optional[Path],
+    jobs: Optional[int],
+) -> None:
+    """Analyze DICOM/NIfTI data and generate BIDS mapping.
+
+    INPUT_DIR is the directory containing DICOM or NIfTI files.
+    """
+    from ezbids_cli.core.analyzer import Analyzer
+
+    console = get_console()
+
+    if output_dir is None:
+        output_dir = input_dir / "ezbids_work"
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    console.print(f"[bold blue]Analyzing:[/] {input_dir}")
+    console.print(f"[bold blue]Output:[/] {output_dir}")
+
+    analyzer = Analyzer(input_dir, output_dir, config_path=config, jobs=jobs)
+    analyzer.analyze(keep_objects=False)
+
+    output_file = output_dir / "ezBIDS_core.json"
+    console.print(f"[bold green]Analysis complete:[/] {output_file}")
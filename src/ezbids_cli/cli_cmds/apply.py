@@ -0,0 +1,42 @@
+"""``ezbids apply`` command."""
+
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from ezbids_cli._console import get_console
+from ezbids_cli.cli_cmds._options import EXISTING_FILE, OUTPUT_DIR, jobs_option, link_mode_option
+
+
+@click.command("apply")
+@click.argument("finalized_file", type=EXISTING_FILE)
+@click.argument("output_dir", type=OUTPUT_DIR)
+@link_mode_option
+@jobs_option
+@click.pass_context
+def cmd(
+    ctx: click.Context,
+    finalized_file: Path,
+    output_dir: Path,
+    link_mode: str,
+    jobs: Optional[int],
+) -> None:
+    """Apply finalized BIDS mappings to create dataset.
+
+    FINALIZED_FILE is the finalized.json file from the review command.
+    OUTPUT_DIR is the directory where the BIDS dataset will be created.
+    """
+    from ezbids_cli._json import load_json
+    from ezbids_cli.convert.converter import BIDSConverter
+
+    console = get_console()
+    console.print(f"[bold blue]Applying:[/] {finalized_file}")
+    console.print(f"[bold blue]Output:[/] {output_dir}")
+
+    data = load_json(finalized_file)
+
+    converter = BIDSConverter(data, output_dir, link_mode=link_mode, jobs=jobs)
+    converter.convert()
+
+    console.print(f"[bold green]BIDS dataset created:[/] {output_dir}")
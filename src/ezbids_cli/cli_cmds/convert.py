@@ -0,0 +1,83 @@
+"""``ezbids convert`` command."""
+
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from ezbids_cli._console import get_console
+from ezbids_cli.cli_cmds._options import (
+    EXISTING_DIR,
+    OUTPUT_DIR,
+    config_option,
+    jobs_option,
+    link_mode_option,
+)
+
+
+@click.command("convert")
+@click.argument("input_dir", type=EXISTING_DIR)
+@click.option(
+    "-o",
+    "--output-dir",
+    type=OUTPUT_DIR,
+    required=True,
+    help="Output directory for BIDS dataset",
+)
+@config_option
+@link_mode_option
+@jobs_option
+@click.option("--skip-validation", is_flag=True, help="Skip BIDS validation")
+@click.pass_context
+def cmd(
+    ctx: click.Context,
+    input_dir: Path,
+    output_dir: Path,
+    config: Optional[Path],
+    link_mode: str,
+    jobs: Optional[int],
+    skip_validation: bool,
+) -> None:
+    """Convert DICOM/NIfTI data to BIDS format.
+
+    INPUT_DIR is the directory containing DICOM or NIfTI files.
+    """
+    from ezbids_cli.convert.converter import BIDSConverter
+    from ezbids_cli.core.analyzer import Analyzer
+
+    console = get_console()
+
+    work_dir = output_dir / ".ezbids_work"
+    work_dir.mkdir(parents=True, exist_ok=True)
+
+    console.print(f"[bold blue]Converting:[/] {input_dir}")
+    console.print(f"[bold blue]Output:[/] {output_dir}")
+
+    # Step 1: Analyze
+    console.print("[bold]Step 1/2:[/] Analyzing data...")
+    analyzer = Analyzer(input_dir, work_dir, config_path=config, jobs=jobs)
+    analysis_result = analyzer.analyze()
+
+    # Step 2: Convert
+    console.print("[bold]Step 2/2:[/] Converting to BIDS...")
+    converter = BIDSConverter(
+        analysis_result,
+        output_dir,
+        link_mode=link_mode,
+        jobs=jobs,
+    )
+    converter.convert()
+
+    if not skip_validation:
+        console.print("[bold]Validating BIDS output...")
+        from ezbids_cli.validation.validator import print_validation_result, validate_dataset
+
+        verbose = ctx.obj.get("verbose", 0) > 0
+        bids_dataset_dir = output_dir / "dataset"
+        if bids_dataset_dir.exists():
+            result = validate_dataset(bids_dataset_dir, verbose=verbose, jobs=jobs)
+        else:
+            result = validate_dataset(output_dir, verbose=verbose, jobs=jobs)
+        print_validation_result(result, verbose=verbose)
+
+    console.print(f"[bold green]Conversion complete:[/] {output_dir}")
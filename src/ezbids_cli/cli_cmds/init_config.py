@@ -0,0 +1,43 @@
+"""``ezbids init-config`` command."""
+
+from pathlib import Path
+
+import click
+
+from ezbids_cli._console import get_console
+from ezbids_cli.cli_cmds._options import EXISTING_DIR
+
+
+@click.command("init-config")
+@click.argument("input_dir", type=EXISTING_DIR)
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=Path("ezbids_config.yaml"),
+    help="Output config file",
+)
+@click.pass_context
+def cmd(
+    ctx: click.Context,
+    input_dir: Path,
+    output: Path,
+) -> None:
+    """Generate a configuration template from analyzed data.
+
+    INPUT_DIR is the directory containing DICOM or NIfTI files.
+    """
+    from ezbids_cli.config.exporter import export_config
+    from ezbids_cli.core.analyzer import Analyzer
+
+    console = get_console()
+    console.print(f"[bold blue]Analyzing:[/] {input_dir}")
+
+    work_dir = input_dir / ".ezbids_work"
+    work_dir.mkdir(parents=True, exist_ok=True)
+
+    analyzer = Analyzer(input_dir, work_dir)
+    analysis_result = analyzer.analyze()
+
+    export_config(analysis_result, output)
+    console.print(f"[bold green]Config template created:[/] {output}")
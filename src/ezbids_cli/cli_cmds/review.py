@@ -0,0 +1,27 @@
+"""``ezbids review`` command."""
+
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from ezbids_cli.cli_cmds._options import EXISTING_FILE, config_option
+
+
+@click.command("review")
+@click.argument("analysis_file", type=EXISTING_FILE)
+@config_option
+@click.pass_context
+def cmd(
+    ctx: click.Context,
+    analysis_file: Path,
+    config: Optional[Path],
+) -> None:
+    """Launch interactive TUI to review and edit BIDS mappings.
+
+    ANALYSIS_FILE is the ezBIDS_core.json file from the analyze command.
+    """
+    from ezbids_cli.tui.app import EzbidsTUI
+
+    app = EzbidsTUI(analysis_file, config_path=config)
+    app.run()
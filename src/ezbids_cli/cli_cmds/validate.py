@@ -0,0 +1,27 @@
+"""``ezbids validate`` command."""
+
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from ezbids_cli._console import get_console
+from ezbids_cli.cli_cmds._options import EXISTING_DIR, jobs_option
+
+
+@click.command("validate")
+@click.argument("bids_dir", type=EXISTING_DIR)
+@jobs_option
+@click.pass_context
+def cmd(ctx: click.Context, bids_dir: Path, jobs: Optional[int]) -> None:
+    """Run BIDS validator on a dataset.
+
+    BIDS_DIR is the root directory of the BIDS dataset.
+    """
+    from ezbids_cli.validation.validator import print_validation_result, validate_dataset
+
+    console = get_console()
+    verbose = ctx.obj.get("verbose", 0) > 0
+    console.print(f"[bold blue]Validating:[/] {bids_dir}")
+    result = validate_dataset(bids_dir, verbose=verbose, jobs=jobs)
+    print_validation_result(result, verbose=verbose)
@@ -3,11 +3,17 @@
 This module exports analysis results as reusable configuration files.
 """
 
+import re
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:  # libyaml not available
+    from yaml import SafeDumper as _Dumper
+
 
 def export_config(analysis_result: dict[str, Any], output_path: Path) -> None:
     """
@@ -31,7 +37,7 @@ def export_config(analysis_result: dict[str, Any], output_path: Path) -> None:
     }
 
     with open(output_path, "w") as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(config, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
 
 
 def _extract_dataset_config(analysis_result: dict[str, Any]) -> dict[str, Any]:
@@ -48,39 +54,33 @@ def _extract_dataset_config(analysis_result: dict[str, Any]) -> dict[str, Any]:
 def _extract_series_rules(analysis_result: dict[str, Any]) -> list[dict[str, Any]]:
     """Extract series mapping rules from analysis result."""
     series_list = analysis_result.get("series", [])
-    rules = []
-
-    for series in series_list:
-        series_desc = series.get("SeriesDescription", "")
-        datatype = series.get("datatype", "")
-        suffix = series.get("suffix", "")
-        series_type = series.get("type", "")
-
-        if not series_desc:
-            continue
-
-        rule: dict[str, Any] = {
-            "match": {
-                "series_description": f".*{_escape_regex(series_desc)}.*",
-            },
-        }
-
-        if series_type == "exclude":
-            rule["exclude"] = True
-        elif datatype and suffix:
+    return [rule for series in series_list if (rule := _series_rule(series)) is not None]
+
+
+def _series_rule(series: dict[str, Any]) -> dict[str, Any] | None:
+    """Build the mapping rule for a single series, or None if it has no description."""
+    get = series.get
+    series_desc = get("SeriesDescription", "")
+    if not series_desc:
+        return None
+
+    rule: dict[str, Any] = {
+        "match": {
+            "series_description": f".*{re.escape(series_desc)}.*",
+        },
+    }
+
+    if get("type", "") == "exclude":
+        rule["exclude"] = True
+    else:
+        datatype = get("datatype", "")
+        suffix = get("suffix", "")
+        if datatype and suffix:
             rule["datatype"] = datatype
             rule["suffix"] = suffix
 
-            entities = series.get("entities", {})
+            entities = get("entities", {})
             if entities:
                 rule["entities"] = entities
 
-        rules.append(rule)
-
-    return rules
-
-
-def _escape_regex(text: str) -> str:
-    """Escape special regex characters in text."""
-    import re
-    return re.escape(text)
+    return rule
@@ -3,16 +3,92 @@
 This module handles the conversion of analyzed data into BIDS format.
 """
 
-import json
+import bisect
 import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import Any
-
-from rich.console import Console
-
-from ezbids_cli.schema import get_bids_version, get_entity_order, build_entity_mapping
-
-console = Console()
+from typing import Any, Optional
+
+from ezbids_cli._console import get_console
+from ezbids_cli._json import dumps_json
+
+_INVALID_NAME_CHARS = re.compile(r"[^\w\-]+")
+_MULTI_UNDERSCORE = re.compile(r"_+")
+
+_EMPTY_INFO: dict[str, Any] = {}
+
+# O_BINARY only exists (and matters) on Windows
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Output extension for each known item name
+_ITEM_EXTENSIONS = {
+    "nii.gz": ".nii.gz",
+    "json": ".json",
+    "bval": ".bval",
+    "bvec": ".bvec",
+    "tsv": ".tsv",
+}
+
+
+def _write_bytes(path: Path | str, data: bytes) -> None:
+    """Write data to path with raw os-level calls, replacing any content."""
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _copy_file(src: str, dst: str) -> None:
+    """
+    Copy src to dst, preserving metadata like ``shutil.copy2``.
+
+    Uses ``os.copy_file_range`` where available so the kernel copies the
+    data, or shares extents on copy-on-write filesystems (btrfs, XFS).
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None:
+        shutil.copy2(src, dst)
+        return
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        remaining = os.fstat(src_fd).st_size
+        try:
+            while remaining > 0:
+                copied = copy_file_range(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except OSError:
+            # Unsupported for this file pair; restart with a plain copy
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst)
+    shutil.copystat(src, dst)
+
+
+def _symlink_target(src: str, resolved_dirs: dict[str, str]) -> str:
+    """
+    Return the absolute target for a symlink, raising if src is missing.
+
+    resolved_dirs memoizes canonical source directories for one conversion.
+    """
+    # Files of one series share a directory, so resolve each directory once
+    directory, name = os.path.split(src)
+    real_dir = resolved_dirs.get(directory)
+    if real_dir is None:
+        real_dir = resolved_dirs[directory] = os.path.realpath(directory)
+    target = os.path.join(real_dir, name)
+    if not os.path.exists(target):
+        raise FileNotFoundError(src)
+    return target
 
 
 class BIDSConverter:
@@ -23,6 +99,7 @@ class BIDSConverter:
         analysis_data: dict[str, Any],
         output_dir: Path,
         link_mode: str = "hardlink",
+        jobs: Optional[int] = None,
     ) -> None:
         """
         Initialize the converter.
@@ -35,12 +112,28 @@ class BIDSConverter:
             Output directory for BIDS dataset
         link_mode : str
             File linking strategy: "hardlink", "symlink", or "copy"
+        jobs : int, optional
+            Number of threads used to write and link files. Defaults to the
+            number of CPUs.
         """
         self.data = analysis_data
         self.output_dir = Path(output_dir)
         self.link_mode = link_mode
-        self.entity_order = get_entity_order()
-        self.entity_mapping = build_entity_mapping()
+        self.jobs = jobs or os.cpu_count() or 4
+
+    @cached_property
+    def entity_order(self) -> tuple[str, ...]:
+        """Canonical BIDS entity order for filenames, read once per converter."""
+        from ezbids_cli.schema import get_entity_order
+
+        return tuple(get_entity_order())
+
+    @cached_property
+    def entity_mapping(self) -> dict[str, str]:
+        """Mapping from full entity names to short keys, built once per converter."""
+        from ezbids_cli.schema import build_entity_mapping
+
+        return build_entity_mapping()
 
     def convert(self) -> None:
         """Run the full BIDS conversion."""
@@ -50,6 +143,9 @@ class BIDSConverter:
         bids_dir = self.output_dir / dataset_name
         bids_dir.mkdir(parents=True, exist_ok=True)
 
+        from rich.markup import escape
+
+        console = get_console()
         console.print(f"[dim]Creating BIDS dataset: {bids_dir}[/]")
 
         # Write dataset-level files
@@ -58,28 +154,52 @@ class BIDSConverter:
         self._write_bidsignore(bids_dir)
         self._write_participants(bids_dir)
 
-        # Convert all objects, tracking filenames to handle duplicates
+        # Resolve output names first, tracking filenames to handle duplicates.
+        # This pass is order-sensitive, so it runs sequentially.
         objects = self.data.get("objects", [])
         self._filename_counts: dict[str, int] = {}
+        self._created_dirs: set[str] = set()
+        self._resolved_dirs: dict[str, str] = {}
 
+        bids_dir_str = os.fspath(bids_dir)
+        plans: dict[str, tuple[str, str, str, list[dict[str, Any]]]] = {}
         for obj in objects:
-            self._convert_object(obj, bids_dir)
+            plan = self._plan_object(obj, bids_dir_str)
+            if plan is None:
+                continue
+            # Objects written in parallel must not share output files. An
+            # automatic run number can still collide with an explicit one;
+            # as in a sequential write, the later object wins.
+            path, base_filename, suffix, _ = plan
+            output_stem = f"{path}/{base_filename}_{suffix}"
+            if output_stem in plans:
+                console.print(
+                    f"[yellow]Warning: Duplicate BIDS output {escape(output_stem)}, "
+                    "keeping the later acquisition[/]"
+                )
+            plans[output_stem] = plan
+
+        # Writing and linking is I/O bound, so spread it over threads
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            for _ in executor.map(self._write_object, plans.values()):
+                pass
 
         console.print(f"[green]BIDS dataset created: {bids_dir}[/]")
 
     def _sanitize_name(self, name: str) -> str:
         """Sanitize dataset name for filesystem."""
-        import re
         # Replace spaces and special chars with underscores
-        name = re.sub(r"[^\w\-]", "_", name)
+        name = _INVALID_NAME_CHARS.sub("_", name)
         # Remove multiple underscores
-        name = re.sub(r"_+", "_", name)
+        name = _MULTI_UNDERSCORE.sub("_", name)
         return name.strip("_") or "dataset"
 
     def _write_dataset_description(self, bids_dir: Path) -> None:
         """Write dataset_description.json."""
         desc = self.data.get("datasetDescription", {})
 
+        from ezbids_cli.schema import get_bids_version
+
         # Ensure required fields
         desc.setdefault("Name", "Untitled")
         desc.setdefault("BIDSVersion", get_bids_version())
@@ -94,8 +214,7 @@ class BIDSConverter:
             }]
 
         output_file = bids_dir / "dataset_description.json"
-        with open(output_file, "w") as f:
-            json.dump(desc, f, indent=2)
+        _write_bytes(output_file, dumps_json(desc))
 
     def _write_readme(self, bids_dir: Path) -> None:
         """Write README file."""
@@ -104,8 +223,7 @@ class BIDSConverter:
             readme = "# Dataset\n\nConverted using ezBIDS-cli.\n"
 
         output_file = bids_dir / "README"
-        with open(output_file, "w") as f:
-            f.write(readme)
+        _write_bytes(output_file, readme.encode("utf-8"))
 
     def _write_bidsignore(self, bids_dir: Path) -> None:
         """Write .bidsignore file."""
@@ -116,8 +234,7 @@ class BIDSConverter:
         ]
 
         output_file = bids_dir / ".bidsignore"
-        with open(output_file, "w") as f:
-            f.write("\n".join(ignore_patterns) + "\n")
+        _write_bytes(output_file, ("\n".join(ignore_patterns) + "\n").encode("utf-8"))
 
     def _write_participants(self, bids_dir: Path) -> None:
         """Write participants.tsv and participants.json."""
@@ -129,166 +246,200 @@ class BIDSConverter:
             return
 
         # Build column headers
-        columns = ["participant_id"] + list(participants_column.keys())
+        extra_columns = tuple(participants_column)
+        rows = ["\t".join(("participant_id",) + extra_columns) + "\n"]
 
         # Write TSV
-        tsv_file = bids_dir / "participants.tsv"
-        with open(tsv_file, "w") as f:
-            f.write("\t".join(columns) + "\n")
-
+        if not extra_columns:
+            rows.extend(f"sub-{subject['subject']}\n" for subject in subjects)
+        else:
             for idx, subject in enumerate(subjects):
-                subj_id = f"sub-{subject['subject']}"
-                row = [subj_id]
-
                 # Get participant info
-                info = participants_info.get(str(idx), {})
-                for col in columns[1:]:
-                    value = info.get(col, "n/a")
-                    row.append(str(value) if value is not None else "n/a")
+                info = participants_info.get(str(idx)) or _EMPTY_INFO
+                row = [f"sub-{subject['subject']}"]
+                row.extend(
+                    "n/a" if (value := info.get(col)) is None else str(value)
+                    for col in extra_columns
+                )
+                rows.append("\t".join(row) + "\n")
 
-                f.write("\t".join(row) + "\n")
+        tsv_file = bids_dir / "participants.tsv"
+        _write_bytes(tsv_file, "".join(rows).encode("utf-8"))
 
         # Write JSON
         json_file = bids_dir / "participants.json"
-        with open(json_file, "w") as f:
-            json.dump(participants_column, f, indent=2)
+        _write_bytes(json_file, dumps_json(participants_column))
+
+    def _plan_object(
+        self, obj: dict[str, Any], bids_dir: str
+    ) -> Optional[tuple[str, str, str, list[dict[str, Any]]]]:
+        """
+        Resolve the output location of a single object.
 
-    def _convert_object(self, obj: dict[str, Any], bids_dir: Path) -> None:
-        """Convert a single object to BIDS format."""
+        Returns ``(path, base_filename, suffix, items)``, or None if the
+        object is not converted.
+        """
         obj_type = obj.get("_type", "")
 
         # Skip excluded objects
         if obj_type == "exclude" or obj.get("exclude", False):
-            return
+            return None
 
         if not obj_type or "/" not in obj_type:
-            return
+            return None
 
         datatype, suffix = obj_type.split("/", 1)
-        entities = obj.get("_entities", {}).copy()
+        entities = obj.get("_entities", {})
 
         # Build BIDS path
         path = self._build_bids_path(entities, datatype, bids_dir)
-        path.mkdir(parents=True, exist_ok=True)
+        if path not in self._created_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._created_dirs.add(path)
 
         # Build BIDS filename and handle duplicates
-        base_filename = self._build_bids_filename(entities, suffix)
-        full_key = f"{path}/{base_filename}_{suffix}"
+        tokens = self._build_entity_tokens(entities)
+        base_filename = "_".join(token for _, token in tokens)
+        full_key = path + "/" + base_filename + "_" + suffix
 
         # Track filename usage and add run numbers for duplicates
         if full_key in self._filename_counts:
             self._filename_counts[full_key] += 1
             run_num = self._filename_counts[full_key]
             # Add or update run entity
-            entities["run"] = f"{run_num:02d}"
-            base_filename = self._build_bids_filename(entities, suffix)
+            base_filename = self._with_run_token(tokens, run_num)
         else:
             self._filename_counts[full_key] = 1
 
+        return path, base_filename, suffix, obj.get("items", [])
+
+    def _write_object(self, plan: tuple[str, str, str, list[dict[str, Any]]]) -> None:
+        """Write and link the files of a planned object."""
+        path, base_filename, suffix, items = plan
+
         # Process each item (nifti, json, bvec, bval, etc.)
-        items = obj.get("items", [])
+        links = []
         for item in items:
-            self._process_item(item, path, base_filename, suffix)
+            link = self._process_item(item, path, base_filename, suffix)
+            if link is not None:
+                links.append(link)
+
+        self._link_batch(links)
 
     def _build_bids_path(
         self,
         entities: dict[str, str],
         datatype: str,
-        bids_dir: Path,
-    ) -> Path:
+        bids_dir: str,
+    ) -> str:
         """Build the BIDS directory path for an object."""
-        path = bids_dir
-
         # Add subject directory
         subject = entities.get("subject", "unknown")
-        path = path / f"sub-{subject}"
+        path = f"{bids_dir}/sub-{subject}"
 
         # Add session directory if present
         session = entities.get("session")
         if session:
-            path = path / f"ses-{session}"
+            path = f"{path}/ses-{session}"
 
         # Add datatype directory
-        path = path / datatype
+        return f"{path}/{datatype}"
 
-        return path
+    def _build_entity_tokens(self, entities: dict[str, str]) -> list[tuple[int, str]]:
+        """
+        Build the entity tokens of a BIDS filename.
 
-    def _build_bids_filename(
-        self,
-        entities: dict[str, str],
-        suffix: str,
-    ) -> str:
-        """Build the BIDS filename (without extension)."""
-        tokens = []
+        Returns ``(rank, "key-value")`` pairs in canonical entity order.
+        """
+        from ezbids_cli.schema import get_entity_filename_keys
 
-        # Add entities in correct order
-        for entity_name in self.entity_order:
-            short_key = self.entity_mapping.get(entity_name, entity_name[:3])
-            value = entities.get(entity_name)
+        ranks = get_entity_filename_keys()
+        tokens = [
+            (ranks[name][0], f"{ranks[name][1]}-{value}")
+            for name, value in entities.items()
+            if value and name in ranks
+        ]
+        # Put entities in correct order
+        tokens.sort()
+        return tokens
 
-            if value:
-                tokens.append(f"{short_key}-{value}")
+    def _with_run_token(self, tokens: list[tuple[int, str]], run_num: int) -> str:
+        """Return the filename for tokens with the run entity set to run_num."""
+        from ezbids_cli.schema import get_entity_filename_keys
 
-        return "_".join(tokens)
+        run_rank, run_key = get_entity_filename_keys()["run"]
+        tokens = [token for token in tokens if token[0] != run_rank]
+        bisect.insort(tokens, (run_rank, f"{run_key}-{run_num:02d}"))
+        return "_".join(token for _, token in tokens)
 
     def _process_item(
         self,
         item: dict[str, Any],
-        output_path: Path,
+        output_path: str,
         base_filename: str,
         suffix: str,
-    ) -> None:
-        """Process a single item (file) within an object."""
+    ) -> Optional[tuple[str, str]]:
+        """
+        Process a single item (file) within an object.
+
+        Sidecars are written directly. For all other files the
+        ``(source, destination)`` pair to link is returned.
+        """
         item_path = item.get("path", "")
         item_name = item.get("name", "")
 
         if not item_path:
-            return
-
-        source_path = Path(item_path)
+            return None
 
         # Determine extension
-        if item_name == "nii.gz":
-            ext = ".nii.gz"
-        elif item_name == "json":
-            ext = ".json"
-        elif item_name == "bval":
-            ext = ".bval"
-        elif item_name == "bvec":
-            ext = ".bvec"
-        elif item_name == "tsv":
-            ext = ".tsv"
-        else:
-            ext = source_path.suffix
+        ext = _ITEM_EXTENSIONS.get(item_name)
+        if ext is None:
+            ext = os.path.splitext(item_path)[1]
 
         # Build output filename
-        output_file = output_path / f"{base_filename}_{suffix}{ext}"
+        output_file = f"{output_path}/{base_filename}_{suffix}{ext}"
 
         # Handle JSON specially - may need to update sidecar
         if item_name == "json" and "sidecar" in item:
             sidecar = item["sidecar"]
-            with open(output_file, "w") as f:
-                json.dump(sidecar, f, indent=2)
-            return
+            _write_bytes(output_file, dumps_json(sidecar))
+            return None
 
-        # Link or copy the file
-        if not source_path.exists():
-            console.print(f"[yellow]Warning: Source file not found: {source_path}[/]")
-            return
-
-        # Remove existing file if present
-        if output_file.exists():
-            output_file.unlink()
+        return item_path, output_file
 
+    def _link_batch(self, links: list[tuple[str, str]]) -> None:
+        """Link or copy each ``(source, destination)`` pair."""
+        for src, dst in links:
+            try:
+                try:
+                    self._link_file(src, dst)
+                except FileExistsError:
+                    # Replace the file left by a previous conversion, but
+                    # only once there is something to replace it with
+                    if not os.path.exists(src):
+                        raise FileNotFoundError(src) from None
+                    os.unlink(dst)
+                    self._link_file(src, dst)
+            except FileNotFoundError:
+                # A missing destination directory is a real error, not a
+                # missing source
+                if os.path.exists(src):
+                    raise
+                get_console().print(f"[yellow]Warning: Source file not found: {src}[/]")
+
+    def _link_file(self, src: str, dst: str) -> None:
+        """Place a single file according to the link mode."""
         if self.link_mode == "hardlink":
             try:
-                os.link(source_path, output_file)
+                os.link(src, dst)
+            except (FileExistsError, FileNotFoundError):
+                raise
             except OSError:
                 # Fall back to copy if hardlink fails
-                import shutil
-                shutil.copy2(source_path, output_file)
+                _copy_file(src, dst)
         elif self.link_mode == "symlink":
-            output_file.symlink_to(source_path.resolve())
+            os.symlink(_symlink_target(src, self._resolved_dirs), dst)
         else:  # copy
-            import shutil
-            shutil.copy2(source_path, output_file)
+            if os.path.lexists(dst):
+                raise FileExistsError(dst)
+            _copy_file(src, dst)
@@ -1,19 +1,21 @@
 """Main analysis orchestration for ezBIDS CLI."""
 
-import json
+import copy
+from collections.abc import Iterator
 from dataclasses import asdict
 from pathlib import Path
 from typing import Any, Optional
 
-from rich.console import Console
-
+from ezbids_cli._console import get_console
+from ezbids_cli._json import stream_json
 from ezbids_cli.core.dataset import (
     determine_unique_series,
     generate_dataset_list,
     organize_dataset,
+    scan_directory,
 )
 from ezbids_cli.core.identification import identify_all_acquisitions
-from ezbids_cli.core.entities import extract_entity_labels
+from ezbids_cli.core.entities import extract_acquisition_entities
 from ezbids_cli.preprocess.dcm2niix import preprocess_input
 from ezbids_cli.core.models import (
     Acquisition,
@@ -25,7 +27,26 @@ from ezbids_cli.core.models import (
     Session,
 )
 
-console = Console()
+console = get_console()
+
+# Column definitions for participants.json; shared, so treat as read-only
+PARTICIPANTS_COLUMNS: dict[str, dict] = {
+    "species": {
+        "Description": "Species of participant",
+        "Levels": {"homo sapiens": "Human"},
+    },
+    "sex": {
+        "Description": "Biological sex of participant",
+        "Levels": {"M": "Male", "F": "Female"},
+    },
+    "age": {
+        "Description": "Age of participant in years",
+    },
+    "handedness": {
+        "Description": "Handedness of participant",
+        "Levels": {"R": "Right", "L": "Left", "A": "Ambidextrous"},
+    },
+}
 
 
 class Analyzer:
@@ -36,6 +57,7 @@ class Analyzer:
         input_dir: Path,
         output_dir: Path,
         config_path: Optional[Path] = None,
+        jobs: Optional[int] = None,
     ) -> None:
         """
         Initialize the analyzer.
@@ -48,45 +70,64 @@ class Analyzer:
             Directory for output files
         config_path : Path, optional
             Path to configuration YAML file
+        jobs : int, optional
+            Number of worker processes for reading files. Defaults to the
+            number of CPUs.
         """
         self.input_dir = input_dir
         self.output_dir = output_dir
         self.config_path = config_path
+        self.jobs = jobs
         self.config: dict[str, Any] = {}
 
         if config_path and config_path.exists():
             import yaml
+
+            try:
+                from yaml import CSafeLoader as Loader
+            except ImportError:  # libyaml not available
+                from yaml import SafeLoader as Loader
+
             with open(config_path) as f:
-                self.config = yaml.safe_load(f) or {}
+                self.config = yaml.load(f, Loader=Loader) or {}
 
-    def analyze(self) -> dict[str, Any]:
+    def analyze(self, keep_objects: bool = True) -> dict[str, Any]:
         """
         Run the full analysis pipeline.
 
+        Parameters
+        ----------
+        keep_objects : bool
+            Whether the returned result includes the objects list. When
+            False, objects are built one at a time while ezBIDS_core.json is
+            written and the result's "objects" list is empty.
+
         Returns
         -------
         dict[str, Any]
             Analysis result as dictionary (compatible with ezBIDS_core.json format)
         """
-        console.print("[dim]Step 1/4: Discovering files...[/]")
+        console.print("[dim]Step 1/3: Discovering files...[/]")
         acquisitions = self._discover_and_load_files()
 
-        console.print("[dim]Step 2/4: Organizing dataset...[/]")
+        console.print("[dim]Step 2/3: Organizing dataset...[/]")
         acquisitions = organize_dataset(acquisitions)
 
-        console.print("[dim]Step 3/4: Identifying datatypes and suffixes...[/]")
-        acquisitions = identify_all_acquisitions(acquisitions)
-
-        console.print("[dim]Step 4/4: Extracting entity labels...[/]")
-        acquisitions = extract_entity_labels(acquisitions)
+        # Entity labels are extracted in the same pass, once each
+        # acquisition's datatype and suffix are final
+        console.print("[dim]Step 3/3: Identifying datatypes, suffixes and entity labels...[/]")
+        acquisitions = identify_all_acquisitions(
+            acquisitions, on_identified=extract_acquisition_entities
+        )
 
-        # Build result structure
-        result = self._build_result(acquisitions)
+        # Build result structure; objects are generated while writing
+        objects: list[dict] = []
+        result = self._build_result(acquisitions, objects if keep_objects else None)
 
         # Save to output directory
         output_file = self.output_dir / "ezBIDS_core.json"
-        with open(output_file, "w") as f:
-            json.dump(result, f, indent=2, default=str)
+        stream_json(result, output_file, default=str)
+        result["objects"] = objects
 
         console.print(f"[green]Analysis saved to {output_file}[/]")
 
@@ -102,9 +143,8 @@ class Analyzer:
         )
 
         # Check for NIfTI files
-        nifti_files = list(data_dir.rglob("*.nii.gz")) + list(
-            data_dir.rglob("*.nii")
-        )
+        scan = scan_directory(data_dir)
+        nifti_files = scan[".nii.gz"] + scan[".nii"]
 
         if not nifti_files:
             console.print(
@@ -114,24 +154,33 @@ class Analyzer:
 
         console.print(f"[dim]Found {len(nifti_files)} NIfTI files[/]")
 
-        return generate_dataset_list(data_dir, nifti_files)
+        return generate_dataset_list(data_dir, nifti_files, scan=scan, jobs=self.jobs)
+
+    def _build_result(
+        self,
+        acquisitions: list[Acquisition],
+        objects_sink: Optional[list[dict]] = None,
+    ) -> dict[str, Any]:
+        """
+        Build the analysis result structure.
 
-    def _build_result(self, acquisitions: list[Acquisition]) -> dict[str, Any]:
-        """Build the analysis result structure."""
+        "objects" is always a lazy iterator, consumed once while the result
+        is written. Without objects_sink the objects are dropped as soon as
+        they are written; with it, each object is also appended to
+        objects_sink, which then holds the full list once the iterator is
+        exhausted (``analyze(keep_objects=True)``).
+        """
         # Get unique series
         unique_series = determine_unique_series(acquisitions)
 
-        # Build subjects structure
-        subjects = self._build_subjects(acquisitions)
-
-        # Build participants info
-        participants_info = self._build_participants_info(acquisitions)
+        # Build subjects structure and participants info
+        subjects, participants_info = self._build_subjects_and_participants(acquisitions)
 
         # Build series list
         series_list = self._build_series_list(unique_series, acquisitions)
 
-        # Build objects list (all acquisitions)
-        objects_list = self._build_objects_list(acquisitions)
+        # Objects list (all acquisitions), generated while the result is written
+        objects_iter = self._iter_objects(acquisitions, objects_sink)
 
         # Build dataset description
         dataset_desc = self._build_dataset_description()
@@ -143,14 +192,18 @@ class Analyzer:
             "participantsColumn": self._build_participants_columns(),
             "participantsInfo": participants_info,
             "series": series_list,
-            "objects": objects_list,
+            "objects": objects_iter,
             "events": {},
             "BIDSURI": False,
         }
 
-    def _build_subjects(self, acquisitions: list[Acquisition]) -> list[dict]:
-        """Build subjects structure from acquisitions."""
+    def _build_subjects_and_participants(
+        self, acquisitions: list[Acquisition]
+    ) -> tuple[list[dict], dict[str, dict]]:
+        """Build subjects structure and participants info in one pass over acquisitions."""
         subjects_dict: dict[str, dict] = {}
+        sessions_seen: dict[str, set[str]] = {}
+        participants: dict[str, dict] = {}
 
         for acq in acquisitions:
             subj_key = acq.subject
@@ -166,35 +219,19 @@ class Analyzer:
                         }
                     ],
                     "sessions": [],
-                    "_sessions_seen": set(),
                 }
+                sessions_seen[subj_key] = set()
 
             # Add session if not already present
-            if acq.session and acq.session not in subjects_dict[subj_key]["_sessions_seen"]:
+            if acq.session and acq.session not in sessions_seen[subj_key]:
                 subjects_dict[subj_key]["sessions"].append({
                     "session": acq.session,
                     "AcquisitionDate": acq.acquisition_date,
                     "AcquisitionTime": acq.acquisition_time,
                 })
-                subjects_dict[subj_key]["_sessions_seen"].add(acq.session)
+                sessions_seen[subj_key].add(acq.session)
 
-        # Clean up internal tracking
-        result = []
-        for subj in subjects_dict.values():
-            del subj["_sessions_seen"]
-            result.append(subj)
-
-        return result
-
-    def _build_participants_info(
-        self, acquisitions: list[Acquisition]
-    ) -> dict[str, dict]:
-        """Build participants info from acquisitions."""
-        participants: dict[str, dict] = {}
-
-        for acq in acquisitions:
             subj_idx = str(acq.subject_idx)
-
             if subj_idx not in participants:
                 participants[subj_idx] = {
                     "species": acq.patient_species,
@@ -203,27 +240,12 @@ class Analyzer:
                     "handedness": acq.patient_handedness,
                 }
 
-        return participants
+        return list(subjects_dict.values()), participants
 
     def _build_participants_columns(self) -> dict[str, dict]:
         """Build participants column definitions."""
-        return {
-            "species": {
-                "Description": "Species of participant",
-                "Levels": {"homo sapiens": "Human"},
-            },
-            "sex": {
-                "Description": "Biological sex of participant",
-                "Levels": {"M": "Male", "F": "Female"},
-            },
-            "age": {
-                "Description": "Age of participant in years",
-            },
-            "handedness": {
-                "Description": "Handedness of participant",
-                "Levels": {"R": "Right", "L": "Left", "A": "Ambidextrous"},
-            },
-        }
+        # A fresh copy, so callers editing the result leave the template intact
+        return copy.deepcopy(PARTICIPANTS_COLUMNS)
 
     def _build_series_list(
         self,
@@ -233,12 +255,13 @@ class Analyzer:
         """Build series list from unique acquisitions."""
         series_list = []
 
+        # Group object indices by series in one pass
+        series_to_indices: dict[int, list[int]] = {}
+        for i, acq in enumerate(all_acquisitions):
+            series_to_indices.setdefault(acq.series_idx, []).append(i)
+
         for idx, series_acq in enumerate(unique_series):
-            # Find all object indices for this series
-            object_indices = [
-                i for i, acq in enumerate(all_acquisitions)
-                if acq.series_idx == idx
-            ]
+            object_indices = series_to_indices.get(idx, [])
 
             series_list.append({
                 "series_idx": idx,
@@ -255,7 +278,7 @@ class Analyzer:
                 "datatype": series_acq.datatype,
                 "suffix": series_acq.suffix,
                 "type": series_acq.type,
-                "entities": series_acq.entities,
+                "entities": series_acq.entities or {},
                 "error": series_acq.error,
                 "message": series_acq.message,
                 "IntendedFor": series_acq.intended_for,
@@ -266,22 +289,23 @@ class Analyzer:
 
         return series_list
 
-    def _build_objects_list(self, acquisitions: list[Acquisition]) -> list[dict]:
-        """Build objects list from all acquisitions."""
-        objects_list = []
-
+    def _iter_objects(
+        self,
+        acquisitions: list[Acquisition],
+        sink: Optional[list[dict]] = None,
+    ) -> Iterator[dict]:
+        """Yield the object for each acquisition, also appending it to sink if given."""
         for idx, acq in enumerate(acquisitions):
             # Build items list (files associated with this acquisition)
             items = []
             for path in acq.paths:
-                item = {
-                    "path": str(path),
-                    "name": self._get_file_type(path),
-                }
-                if str(path).endswith(".json"):
+                file_type = self._get_file_type(path)
+                item = {"path": str(path), "name": file_type}
+                if file_type == "json":
                     item["sidecar"] = acq.sidecar
                 items.append(item)
 
+            entities = acq.entities or {}
             obj = {
                 "idx": idx,
                 "series_idx": acq.series_idx,
@@ -297,11 +321,11 @@ class Analyzer:
                 "datatype": acq.datatype,
                 "suffix": acq.suffix,
                 "type": acq.type,
-                "entities": acq.entities,
+                "entities": entities,
                 "_entities": {
                     "subject": acq.subject,
                     "session": acq.session,
-                    **acq.entities,
+                    **entities,
                 },
                 "_type": acq.type if acq.type else f"{acq.datatype}/{acq.suffix}" if acq.datatype and acq.suffix else "exclude",
                 "exclude": acq.exclude,
@@ -322,25 +346,16 @@ class Analyzer:
                 "validationErrors": [],
                 "validationWarnings": [],
             }
-            objects_list.append(obj)
-
-        return objects_list
+            if sink is not None:
+                sink.append(obj)
+            yield obj
 
     def _get_file_type(self, path: Path) -> str:
         """Get file type from path."""
-        path_str = str(path)
-        if path_str.endswith(".nii.gz"):
+        suffix = path.suffix
+        if suffix == ".gz" and path.name.endswith(".nii.gz"):
             return "nii.gz"
-        elif path_str.endswith(".json"):
-            return "json"
-        elif path_str.endswith(".bval"):
-            return "bval"
-        elif path_str.endswith(".bvec"):
-            return "bvec"
-        elif path_str.endswith(".tsv"):
-            return "tsv"
-        else:
-            return path.suffix.lstrip(".")
+        return suffix.lstrip(".")
 
     def _build_dataset_description(self) -> DatasetDescription:
         """Build dataset description from config or defaults."""
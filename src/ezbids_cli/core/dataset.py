@@ -1,18 +1,43 @@
 """Dataset generation and organization for ezBIDS CLI."""
 
-import json
+import gzip
 import os
 import re
+import struct
+from collections import defaultdict
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
+from itertools import repeat
 from operator import itemgetter
 from pathlib import Path
 from typing import Any, Optional
 
 import nibabel as nib
-from natsort import natsorted
+from natsort import natsort_keygen
 
+from ezbids_cli._json import load_json
 from ezbids_cli.core.models import Acquisition
 
+# Natural sort keys, built once instead of on every natsorted() call
+_natural_key = natsort_keygen()
+_natural_path_key = natsort_keygen(key=str)
+
+_SPLIT_NONALNUM = re.compile(r"[^a-zA-Z0-9]")
+_STRIP_NONALNUM = re.compile(r"[^A-Za-z0-9]+")
+
+
+# Axis index of each phase encoding axis (i=0, j=1, k=2)
+_PE_AXIS_INDEX = {"i": 0, "j": 1, "k": 2}
+
+# Direction label for (orientation axis code, negative PE), e.g. ("A", True) -> "PA"
+_OPPOSITE_AXIS_CODE = {"R": "L", "L": "R", "A": "P", "P": "A", "S": "I", "I": "S"}
+_PE_LABELS = {
+    (code, negative): opposite + code if negative else code + opposite
+    for code, opposite in _OPPOSITE_AXIS_CODE.items()
+    for negative in (False, True)
+}
+
 
 def get_phase_encoding_direction_label(pe_direction: str, orientation: str) -> str:
     """
@@ -34,36 +59,11 @@ def get_phase_encoding_direction_label(pe_direction: str, orientation: str) -> s
     if not pe_direction or not orientation:
         return ""
 
-    # Map from axis to anatomical direction pairs
-    axis_to_dir = {
-        "R": ("R", "L"),
-        "L": ("L", "R"),
-        "A": ("A", "P"),
-        "P": ("P", "A"),
-        "S": ("S", "I"),
-        "I": ("I", "S"),
-    }
-
-    # Get axis index from pe_direction (i=0, j=1, k=2)
-    axis_map = {"i": 0, "j": 1, "k": 2}
-    axis = pe_direction.replace("-", "")[0]
-    if axis not in axis_map:
+    axis_idx = _PE_AXIS_INDEX.get(pe_direction.replace("-", "")[:1])
+    if axis_idx is None or axis_idx >= len(orientation):
         return ""
 
-    axis_idx = axis_map[axis]
-    if axis_idx >= len(orientation):
-        return ""
-
-    ornt_char = orientation[axis_idx]
-    if ornt_char not in axis_to_dir:
-        return ""
-
-    # Determine positive/negative direction
-    pos_dir, neg_dir = axis_to_dir[ornt_char]
-    if "-" in pe_direction:
-        return neg_dir + pos_dir  # e.g., PA, RL
-    else:
-        return pos_dir + neg_dir  # e.g., AP, LR
+    return _PE_LABELS.get((orientation[axis_idx], "-" in pe_direction), "")
 
 
 def correct_phase_encoding(
@@ -115,30 +115,335 @@ def extract_subject_session_from_path(
     """
     subject = ""
     session = ""
+    values = [file_path.lower(), patient_id.lower(), patient_name.lower()]
 
     # Check file path and metadata for sub- and ses- patterns
-    for value in [file_path, patient_id, patient_name]:
-        if "sub-" in value.lower():
-            match = re.split(r"[^a-zA-Z0-9]", value.lower().split("sub-")[-1])[0]
-            subject = match
+    for value in values:
+        if "sub-" in value:
+            subject = _SPLIT_NONALNUM.split(value.split("sub-")[-1])[0]
             break
 
-    for value in [file_path, patient_id, patient_name]:
-        if "ses-" in value.lower():
-            match = re.split(r"[^a-zA-Z0-9]", value.lower().split("ses-")[-1])[0]
-            session = match
+    for value in values:
+        if "ses-" in value:
+            session = _SPLIT_NONALNUM.split(value.split("ses-")[-1])[0]
             break
 
     # Clean up - remove non-alphanumeric characters
-    subject = re.sub(r"[^A-Za-z0-9]+", "", subject)
-    session = re.sub(r"[^A-Za-z0-9]+", "", session)
+    subject = _STRIP_NONALNUM.sub("", subject)
+    session = _STRIP_NONALNUM.sub("", session)
 
     return subject, session
 
 
+# Size of the fixed header block (sizeof_hdr) of each NIfTI version
+_NIFTI1_HEADER_SIZE = 348
+_NIFTI2_HEADER_SIZE = 540
+
+# Below this many images, worker process startup costs more than it saves
+_PARALLEL_MIN_FILES = 32
+
+# Acquisition string fields that take few distinct values within a study
+_SHARED_STRING_FIELDS = (
+    "file_directory",
+    "patient_id",
+    "patient_name",
+    "patient_birth_date",
+    "patient_sex",
+    "study_id",
+    "series_description",
+    "protocol_name",
+    "descriptor",
+    "acquisition_date",
+    "modality",
+    "orientation",
+    "phase_encoding_direction",
+    "direction",
+)
+
+# File kinds collected by scan_directory, matched against the end of the name
+SCAN_EXTENSIONS = (".nii.gz", ".nii", ".json", ".bval", ".bvec")
+
+
+def scan_directory(root: Path) -> dict[str, list[str]]:
+    """
+    Collect imaging files under root in a single directory walk.
+
+    Parameters
+    ----------
+    root : Path
+        Directory to scan recursively
+
+    Returns
+    -------
+    dict[str, list[str]]
+        File paths keyed by extension (one key per entry of
+        ``SCAN_EXTENSIONS``), spelled as ``str(Path(...))`` would spell them
+    """
+    found: dict[str, list[str]] = {ext: [] for ext in SCAN_EXTENSIONS}
+    stack = [str(Path(root))]
+
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    # scandir(".") yields "./name", which Path would shorten
+                    path = entry.name if current == "." else entry.path
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(path)
+                        continue
+                    name = entry.name
+                    for ext in SCAN_EXTENSIONS:
+                        if name.endswith(ext):
+                            found[ext].append(path)
+                            break
+        except OSError:
+            continue
+
+    return found
+
+
+def _read_nifti_header(img_file: str) -> tuple["nib.Nifti1Header", int]:
+    """
+    Read only the header and on-disk size of a NIfTI-1 or NIfTI-2 file.
+
+    Unlike ``nib.load``, this reads a single fixed-size block from the start
+    of the (possibly gzipped) file and builds no image object. The size is
+    taken from the open file descriptor, so no separate path lookup is made.
+
+    Parameters
+    ----------
+    img_file : str
+        Path to a .nii or .nii.gz file
+
+    Returns
+    -------
+    tuple[Nifti1Header or Nifti2Header, int]
+        Parsed header and file size in bytes
+    """
+    with open(img_file, "rb") as raw:
+        filesize = os.fstat(raw.fileno()).st_size
+        if img_file.endswith(".gz"):
+            with gzip.GzipFile(fileobj=raw) as f:
+                block = f.read(_NIFTI2_HEADER_SIZE)
+        else:
+            block = raw.read(_NIFTI2_HEADER_SIZE)
+
+    # sizeof_hdr is the first int32, stored in the file's own byte order
+    sizeof_hdr = {struct.unpack("<i", block[:4])[0], struct.unpack(">i", block[:4])[0]}
+    if _NIFTI2_HEADER_SIZE in sizeof_hdr:
+        return nib.Nifti2Header(block), filesize
+    return nib.Nifti1Header(block[:_NIFTI1_HEADER_SIZE]), filesize
+
+
+def _share_repeated_values(acquisitions: list[Acquisition]) -> None:
+    """
+    Make equal sidecar strings and metadata strings share one object across acquisitions.
+
+    Sidecars from one study repeat most of their keys and string values
+    (scanner, site and sequence fields), and so do short metadata fields
+    such as modality, orientation and patient info. Equal strings are
+    replaced by a single shared instance, which also restores the sharing
+    lost when acquisitions are pickled back from worker processes and lets
+    equality checks on them short-circuit on identity. Lists are left
+    alone: they are mutable, so a shared list edited for one acquisition
+    would change every other acquisition's sidecar too.
+
+    Parameters
+    ----------
+    acquisitions : list[Acquisition]
+        Acquisitions whose sidecars and ``_SHARED_STRING_FIELDS`` are
+        updated in place
+    """
+    strings: dict[str, str] = {}
+
+    def share(value: Any) -> Any:
+        if isinstance(value, str):
+            return strings.setdefault(value, value)
+        return value
+
+    for acq in acquisitions:
+        acq.sidecar = {share(k): share(v) for k, v in acq.sidecar.items()}
+        for name in _SHARED_STRING_FIELDS:
+            setattr(acq, name, share(getattr(acq, name)))
+
+
+def _split_nifti_ext(img_file: str) -> tuple[str, str]:
+    """Split a NIfTI path into its base path and extension (.nii or .nii.gz)."""
+    ext = ".nii.gz" if img_file.endswith(".nii.gz") else os.path.splitext(img_file)[1]
+    return img_file[: -len(ext)], ext
+
+
+def _build_acquisition(
+    img_file: str,
+    companion_files: list[str],
+    today: str,
+) -> Acquisition:
+    """
+    Build an Acquisition for a single NIfTI file.
+
+    Parameters
+    ----------
+    img_file : str
+        Path to the NIfTI image
+    companion_files : list[str]
+        Sidecar/bval/bvec files sharing the image's base path
+    today : str
+        Today's date in ISO format, used for age calculation
+
+    Returns
+    -------
+    Acquisition
+        Acquisition with metadata; subject is empty unless found in the path
+    """
+    img_path = Path(img_file)
+    base_name, ext = _split_nifti_ext(img_file)
+
+    # Find corresponding JSON sidecar
+    json_matches = [f for f in companion_files if f.endswith(".json")]
+
+    if json_matches:
+        json_path = Path(json_matches[0])
+        sidecar = load_json(json_matches[0])
+    else:
+        json_path = Path(base_name + ".json")
+        sidecar = {
+            "ConversionSoftware": "ezBIDS-cli",
+            "ConversionSoftwareVersion": "0.1.0",
+        }
+
+    # Extract metadata with defaults
+    modality = sidecar.get("Modality", "MR")
+    pe_direction = sidecar.get("PhaseEncodingDirection")
+    patient_id = sidecar.get("PatientID", "n/a")
+    patient_name = sidecar.get("PatientName", "n/a")
+    patient_birth_date = sidecar.get("PatientBirthDate", "00000000")
+    if patient_birth_date:
+        patient_birth_date = patient_birth_date.replace("-", "")
+    patient_sex = sidecar.get("PatientSex", "n/a")
+    patient_age = sidecar.get("PatientAge", "n/a")
+    manufacturer = sidecar.get("Manufacturer", "n/a")
+    repetition_time = sidecar.get("RepetitionTime", 0)
+    echo_number = sidecar.get("EchoNumber")
+    echo_time = sidecar.get("EchoTime", 0)
+    series_number = sidecar.get("SeriesNumber", 0)
+    series_description = sidecar.get("SeriesDescription", "n/a")
+    protocol_name = sidecar.get("ProtocolName", "n/a")
+    image_type = sidecar.get("ImageType", [])
+    study_id = sidecar.get("StudyID", img_file.split("/")[0])
+
+    # Acquisition timing
+    acquisition_date_time = sidecar.get("AcquisitionDateTime", "0000-00-00T00:00:00.000000")
+    acquisition_date = sidecar.get("AcquisitionDate", "0000-00-00")
+    acquisition_time = sidecar.get("AcquisitionTime", "00:00:00.000000")
+
+    # Descriptor field
+    descriptor = "SeriesDescription" if series_description != "n/a" else "ProtocolName"
+    if series_description == "n/a" and protocol_name == "n/a":
+        series_description = img_file
+        descriptor = "SeriesDescription"
+
+    # Modified series number for sorting
+    mod_series_number = f"{series_number:02d}" if series_number < 100 else str(series_number)
+
+    # Read the NIfTI header to get image properties
+    filesize = None
+    try:
+        header, filesize = _read_nifti_header(img_file)
+        shape = header.get_data_shape()
+        zooms = header.get_zooms()
+        ndim = len(shape)
+        orientation = "".join(nib.aff2axcodes(header.get_best_affine()))
+
+        # Get volume count
+        try:
+            num_volumes = shape[3]
+        except IndexError:
+            num_volumes = 1
+
+        # Get TR from header if not in sidecar
+        if repetition_time == 0 and len(zooms) == 4:
+            repetition_time = round(float(zooms[-1]), 2)
+            sidecar["RepetitionTime"] = repetition_time
+    except Exception:
+        ndim = 3
+        orientation = None
+        num_volumes = 1
+
+    # Determine phase encoding direction label
+    direction = ""
+    if pe_direction and orientation:
+        corrected_pe, _ = correct_phase_encoding(pe_direction, orientation)
+        direction = get_phase_encoding_direction_label(corrected_pe, orientation)
+
+    # File size, if the header could not be read
+    if filesize is None:
+        filesize = os.stat(img_file).st_size
+
+    # Calculate age if possible
+    age: str | int | float = "n/a"
+    if isinstance(patient_age, (int, float)):
+        age = patient_age
+    elif patient_birth_date and patient_birth_date != "00000000":
+        try:
+            birth_year = int(patient_birth_date[:4])
+            current_year = int(today.split("-")[0])
+            age = current_year - birth_year
+        except (ValueError, IndexError):
+            pass
+
+    # Subject/session extraction
+    extracted_subject, extracted_session = extract_subject_session_from_path(
+        img_file, patient_id, patient_name
+    )
+
+    # Find associated files (bval, bvec, etc.)
+    associated_files = [Path(f) for f in companion_files]
+    paths = sorted([img_path] + associated_files, key=_natural_path_key)
+
+    # Create Acquisition object
+    return Acquisition(
+        nifti_path=img_path,
+        json_path=json_path,
+        paths=paths,
+        file_directory=str(img_path.parent),
+        patient_id=patient_id,
+        patient_name=patient_name,
+        patient_birth_date=patient_birth_date,
+        patient_sex=patient_sex,
+        patient_age=age,
+        # Subject falls back to an auto-assigned ID in generate_dataset_list
+        subject=extracted_subject,
+        session=extracted_session,
+        study_id=study_id,
+        series_number=series_number,
+        modified_series_number=mod_series_number,
+        series_description=series_description,
+        protocol_name=protocol_name,
+        descriptor=descriptor,
+        acquisition_date_time=acquisition_date_time,
+        acquisition_date=acquisition_date,
+        acquisition_time=acquisition_time,
+        modality=modality,
+        image_type=image_type if isinstance(image_type, list) else [image_type],
+        repetition_time=repetition_time,
+        echo_number=echo_number,
+        echo_time=echo_time,
+        num_volumes=num_volumes,
+        ndim=ndim,
+        orientation=orientation,
+        filesize=filesize,
+        phase_encoding_direction=pe_direction,
+        direction=direction,
+        sidecar=sidecar,
+    )
+
+
 def generate_dataset_list(
     input_dir: Path,
-    file_list: Optional[list[Path]] = None,
+    file_list: Optional[Sequence[str | Path]] = None,
+    scan: Optional[dict[str, list[str]]] = None,
+    jobs: Optional[int] = None,
 ) -> list[Acquisition]:
     """
     Generate a list of Acquisition objects from NIfTI/JSON files.
@@ -147,8 +452,13 @@ def generate_dataset_list(
     ----------
     input_dir : Path
         Directory containing NIfTI and JSON files
-    file_list : list[Path], optional
+    file_list : Sequence[str or Path], optional
         Explicit list of files to process. If None, discovers files automatically.
+    scan : dict[str, list[str]], optional
+        Result of ``scan_directory(input_dir)``, if already available.
+    jobs : int, optional
+        Number of worker processes for reading files. Defaults to the
+        number of CPUs.
 
     Returns
     -------
@@ -157,209 +467,86 @@ def generate_dataset_list(
     """
     today = date.today().isoformat()
 
+    if scan is None:
+        scan = scan_directory(input_dir)
+
     # Discover files if not provided
     if file_list is None:
-        file_list = list(input_dir.rglob("*.nii.gz")) + list(input_dir.rglob("*.nii"))
+        candidates = scan[".nii.gz"] + scan[".nii"]
+    else:
+        candidates = [os.fspath(path) for path in file_list]
 
     # Get all related files (JSON, bval, bvec)
-    all_files = (
-        list(input_dir.rglob("*.json"))
-        + list(input_dir.rglob("*.bval"))
-        + list(input_dir.rglob("*.bvec"))
-    )
+    all_files = scan[".json"] + scan[".bval"] + scan[".bvec"]
 
-    img_list = natsorted([str(f) for f in file_list if f.suffix in [".gz", ".nii"]])
-    corresponding_files = natsorted([str(f) for f in all_files])
-
-    acquisitions: list[Acquisition] = []
-    sub_info_list: list[dict] = []
-    sub_info_list_id = "01"
-
-    for img_file in img_list:
-        img_path = Path(img_file)
-
-        # Determine extension
-        if img_file.endswith(".nii.gz"):
-            ext = ".nii.gz"
-        else:
-            ext = img_path.suffix
-
-        # Find corresponding JSON sidecar
-        base_name = str(img_path).replace(ext, "")
-        json_matches = [f for f in corresponding_files if f.endswith(".json") and base_name in f]
-
-        if json_matches:
-            json_path = Path(json_matches[0])
-            with open(json_path) as f:
-                sidecar = json.load(f)
-        else:
-            json_path = Path(base_name + ".json")
-            sidecar = {
-                "ConversionSoftware": "ezBIDS-cli",
-                "ConversionSoftwareVersion": "0.1.0",
-            }
-
-        # Extract metadata with defaults
-        modality = sidecar.get("Modality", "MR")
-        pe_direction = sidecar.get("PhaseEncodingDirection")
-        patient_id = sidecar.get("PatientID", "n/a")
-        patient_name = sidecar.get("PatientName", "n/a")
-        patient_birth_date = sidecar.get("PatientBirthDate", "00000000")
-        if patient_birth_date:
-            patient_birth_date = patient_birth_date.replace("-", "")
-        patient_sex = sidecar.get("PatientSex", "n/a")
-        patient_age = sidecar.get("PatientAge", "n/a")
-        manufacturer = sidecar.get("Manufacturer", "n/a")
-        repetition_time = sidecar.get("RepetitionTime", 0)
-        echo_number = sidecar.get("EchoNumber")
-        echo_time = sidecar.get("EchoTime", 0)
-        series_number = sidecar.get("SeriesNumber", 0)
-        series_description = sidecar.get("SeriesDescription", "n/a")
-        protocol_name = sidecar.get("ProtocolName", "n/a")
-        image_type = sidecar.get("ImageType", [])
-        study_id = sidecar.get("StudyID", img_file.split("/")[0])
-
-        # Acquisition timing
-        acquisition_date_time = sidecar.get("AcquisitionDateTime", "0000-00-00T00:00:00.000000")
-        acquisition_date = sidecar.get("AcquisitionDate", "0000-00-00")
-        acquisition_time = sidecar.get("AcquisitionTime", "00:00:00.000000")
-
-        # Descriptor field
-        descriptor = "SeriesDescription" if series_description != "n/a" else "ProtocolName"
-        if series_description == "n/a" and protocol_name == "n/a":
-            series_description = img_file
-            descriptor = "SeriesDescription"
-
-        # Modified series number for sorting
-        mod_series_number = f"{series_number:02d}" if series_number < 100 else str(series_number)
-
-        # Load NIfTI to get image properties
-        try:
-            image = nib.load(img_file)
-            ndim = image.ndim
-            orientation = "".join(nib.aff2axcodes(image.affine))
-
-            # Get volume count
-            try:
-                num_volumes = image.shape[3]
-            except IndexError:
-                num_volumes = 1
-
-            # Get TR from header if not in sidecar
-            if repetition_time == 0 and len(image.header.get_zooms()) == 4:
-                repetition_time = round(float(image.header.get_zooms()[-1]), 2)
-                sidecar["RepetitionTime"] = repetition_time
-        except Exception:
-            ndim = 3
-            orientation = None
-            num_volumes = 1
-
-        # Determine phase encoding direction label
-        direction = ""
-        if pe_direction and orientation:
-            corrected_pe, _ = correct_phase_encoding(pe_direction, orientation)
-            direction = get_phase_encoding_direction_label(corrected_pe, orientation)
+    img_list = sorted(
+        [path for path in candidates if os.path.splitext(path)[1] in (".gz", ".nii")],
+        key=_natural_key,
+    )
+    corresponding_files = sorted(all_files, key=_natural_key)
+
+    # Index companion files by their path without extension
+    companions: dict[str, list[str]] = defaultdict(list)
+    for f in corresponding_files:
+        companions[os.path.splitext(f)[0]].append(f)
+
+    companion_lists = [companions.get(_split_nifti_ext(f)[0], []) for f in img_list]
+
+    # Reading sidecars and headers is independent per image
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    if jobs > 1 and len(img_list) >= _PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            acquisitions = list(
+                executor.map(
+                    _build_acquisition,
+                    img_list,
+                    companion_lists,
+                    repeat(today),
+                    chunksize=16,
+                )
+            )
+    else:
+        acquisitions = list(map(_build_acquisition, img_list, companion_lists, repeat(today)))
 
-        # File size
-        filesize = os.stat(img_file).st_size
+    _share_repeated_values(acquisitions)
 
-        # Calculate age if possible
-        age: str | int | float = "n/a"
-        if isinstance(patient_age, (int, float)):
-            age = patient_age
-        elif patient_birth_date and patient_birth_date != "00000000":
-            try:
-                birth_year = int(patient_birth_date[:4])
-                current_year = int(today.split("-")[0])
-                age = current_year - birth_year
-            except (ValueError, IndexError):
-                pass
-
-        # Subject/session extraction
-        extracted_subject, extracted_session = extract_subject_session_from_path(
-            img_file, patient_id, patient_name
-        )
+    # Assign subject IDs in file order for data without subject labels
+    subject_number = 1
+    prev_identity: Optional[tuple[str, str, str, str]] = None
 
+    for acq in acquisitions:
         # Track subject info for auto-assignment
         folder = "n/a"
-        if patient_id == "n/a" and patient_name == "n/a" and patient_birth_date == "00000000":
+        if (
+            acq.patient_id == "n/a"
+            and acq.patient_name == "n/a"
+            and acq.patient_birth_date == "00000000"
+        ):
             # Completely anonymized data
-            folder = Path(img_file).parent.name
-
-        sub_info = {
-            "PatientID": patient_id,
-            "PatientName": patient_name,
-            "PatientBirthDate": patient_birth_date,
-            "Folder": folder,
-            "Subject": sub_info_list_id,
-        }
-        sub_info_list.append(sub_info)
+            folder = acq.nifti_path.parent.name
 
         # Increment subject ID if info changed
-        if len(sub_info_list) > 1:
-            prev_info = sub_info_list[-2].copy()
-            prev_info["Subject"] = sub_info_list[-1]["Subject"]  # Ignore Subject field in comparison
-            curr_info = sub_info.copy()
-            if prev_info != curr_info:
-                sub_info_list_id = f"{int(sub_info_list_id) + 1:02d}"
-                sub_info_list[-1]["Subject"] = sub_info_list_id
+        identity = (acq.patient_id, acq.patient_name, acq.patient_birth_date, folder)
+        if prev_identity is not None and identity != prev_identity:
+            subject_number += 1
+        prev_identity = identity
 
         # Use extracted subject or auto-assigned
-        subject = extracted_subject if extracted_subject else sub_info["Subject"]
-        session = extracted_session
-
-        # Find associated files (bval, bvec, etc.)
-        associated_files = [
-            Path(f) for f in corresponding_files
-            if base_name in f and not f.endswith(ext)
-        ]
-        paths = natsorted([img_path] + associated_files, key=str)
-
-        # Create Acquisition object
-        acq = Acquisition(
-            nifti_path=img_path,
-            json_path=json_path,
-            paths=paths,
-            file_directory=str(img_path.parent),
-            patient_id=patient_id,
-            patient_name=patient_name,
-            patient_birth_date=patient_birth_date,
-            patient_sex=patient_sex,
-            patient_age=age,
-            subject=subject,
-            session=session,
-            study_id=study_id,
-            series_number=series_number,
-            modified_series_number=mod_series_number,
-            series_description=series_description,
-            protocol_name=protocol_name,
-            descriptor=descriptor,
-            acquisition_date_time=acquisition_date_time,
-            acquisition_date=acquisition_date,
-            acquisition_time=acquisition_time,
-            modality=modality,
-            image_type=image_type if isinstance(image_type, list) else [image_type],
-            repetition_time=repetition_time,
-            echo_number=echo_number,
-            echo_time=echo_time,
-            num_volumes=num_volumes,
-            ndim=ndim,
-            orientation=orientation,
-            filesize=filesize,
-            phase_encoding_direction=pe_direction,
-            direction=direction,
-            sidecar=sidecar,
-        )
-        acquisitions.append(acq)
+        if not acq.subject:
+            acq.subject = f"{subject_number:02d}"
 
-    # Sort by acquisition parameters
+    # Sort by acquisition parameters, grouping by patient within each date
+    # (the order organize_dataset relies on)
     acquisitions.sort(
         key=lambda x: (
             x.acquisition_date,
-            x.subject,
-            x.session,
+            x.patient_id,
+            x.patient_name,
             x.acquisition_time,
             x.modified_series_number,
+            x.subject,
+            x.session,
             str(x.json_path),
         )
     )
@@ -376,14 +563,16 @@ def organize_dataset(acquisitions: list[Acquisition]) -> list[Acquisition]:
     Parameters
     ----------
     acquisitions : list[Acquisition]
-        List of acquisitions to organize
+        List of acquisitions to organize; sorted in place by date, patient,
+        time and series number
 
     Returns
     -------
     list[Acquisition]
         Organized acquisitions with updated subject/session info
     """
-    # Sort by acquisition parameters
+    # Sort by acquisition parameters; input from generate_dataset_list is
+    # already in this order, which the sort only has to confirm
     acquisitions.sort(
         key=lambda x: (
             x.acquisition_date,
@@ -5,35 +5,49 @@ from acquisition metadata.
 """
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 from ezbids_cli.core.models import Acquisition
 from ezbids_cli.schema import (
-    get_entity_order,
+    get_entity_ranks,
     get_required_entities,
     validate_entities_for_file,
 )
 
+_NON_ALNUM = re.compile(r"[^a-zA-Z0-9]")
 
-def extract_task_entity(acq: Acquisition) -> Optional[str]:
+# Lowercased descriptions and protocol names, memoized as they repeat across a series
+_lower = lru_cache(maxsize=4096)(str.lower)
+
+
+@lru_cache(maxsize=4096)
+def _search_text(series_description: str, protocol_name: str) -> str:
     """
-    Extract task entity from acquisition metadata.
+    Return the lowercased description and protocol name as one text.
 
-    Parameters
-    ----------
-    acq : Acquisition
-        Acquisition to extract task from
+    The two are joined by a newline, which none of the patterns below can
+    match, so a search of the combined text finds a match exactly when a
+    search of either part would.
+    """
+    return f"{series_description}\n{protocol_name}".lower()
 
-    Returns
-    -------
-    str or None
-        Task name or None if not found
+
+def _union(patterns: tuple[re.Pattern, ...]) -> re.Pattern:
     """
-    desc = acq.series_description.lower()
-    proto = acq.protocol_name.lower()
+    Combine patterns into one that matches wherever any of them would.
 
-    # Common task patterns
-    task_patterns = [
+    Extractors try their patterns in priority order, which a plain
+    alternation (leftmost match wins) would not preserve, so the union
+    only serves to rule out texts that match none of them in one scan.
+    """
+    return re.compile("|".join(f"(?:{p.pattern})" for p in patterns))
+
+
+# Common task patterns
+_TASK_PATTERNS = tuple(
+    re.compile(p)
+    for p in (
         r"task[_-]?(\w+)",
         r"(\w+)[_-]?task",
         r"rest",
@@ -44,19 +58,68 @@ def extract_task_entity(acq: Acquisition) -> Optional[str]:
         r"emotion",
         r"faces",
         r"localizer",
-    ]
+    )
+)
+_TASK_ANY = _union(_TASK_PATTERNS)
 
-    for pattern in task_patterns:
-        match = re.search(pattern, desc) or re.search(pattern, proto)
-        if match:
-            task = match.group(1) if match.lastindex else match.group(0)
-            # Clean task name (alphanumeric only)
-            task = re.sub(r"[^a-zA-Z0-9]", "", task)
-            if task and len(task) >= 2:
-                return task
+# Direction codes in priority order. Occurrences cannot overlap, so one scan
+# finds them all and the highest-priority code present wins.
+_DIRECTION_CODES = ("ap", "pa", "lr", "rl", "si", "is")
+_DIRECTION_PATTERN = re.compile(r"[_-](ap|pa|lr|rl|si|is)")
+
+# Common acquisition label patterns
+_ACQ_PATTERNS = tuple(
+    re.compile(p)
+    for p in (
+        r"acq[_-]?(\w+)",
+        r"(highres|lowres|hires|lores)",
+        r"(mb\d+)",  # Multiband
+        r"(norm|prenorm|postnorm)",
+    )
+)
+_ACQ_ANY = _union(_ACQ_PATTERNS)
+
+# Run patterns - be specific to avoid matching other numbers like TI, TE, etc.
+_RUN_PATTERNS = tuple(re.compile(p) for p in (r"run[_-]?(\d+)", r"_r(\d+)_"))
+
+_ECHO_PATTERNS = tuple(re.compile(p) for p in (r"echo[_-]?(\d+)", r"e(\d+)[_-]", r"_e(\d+)"))
+
+_REC_PATTERNS = tuple(
+    re.compile(p) for p in (r"rec[_-]?(\w+)", r"(moco|nomoco)", r"(nd|filtered)")
+)
+_REC_ANY = _union(_REC_PATTERNS)
+
+
+def extract_task_entity(acq: Acquisition) -> Optional[str]:
+    """
+    Extract task entity from acquisition metadata.
+
+    Parameters
+    ----------
+    acq : Acquisition
+        Acquisition to extract task from
+
+    Returns
+    -------
+    str or None
+        Task name or None if not found
+    """
+    desc = _lower(acq.series_description)
+    proto = _lower(acq.protocol_name)
+    text = _search_text(acq.series_description, acq.protocol_name)
+
+    if _TASK_ANY.search(text):
+        for pattern in _TASK_PATTERNS:
+            match = pattern.search(desc) or pattern.search(proto)
+            if match:
+                task = match.group(1) if match.lastindex else match.group(0)
+                # Clean task name (alphanumeric only)
+                task = _NON_ALNUM.sub("", task)
+                if task and len(task) >= 2:
+                    return task
 
     # Default to "rest" for resting state
-    if "rest" in desc or "rest" in proto or "rsfmri" in desc:
+    if "rest" in text or "rsfmri" in desc:
         return "rest"
 
     # For func data without clear task, use generic name
@@ -85,21 +148,13 @@ def extract_direction_entity(acq: Acquisition) -> Optional[str]:
         return acq.direction
 
     # Try to extract from description
-    desc = acq.series_description.lower()
-    proto = acq.protocol_name.lower()
-
-    direction_patterns = [
-        (r"[_-](ap)[_-]?", "AP"),
-        (r"[_-](pa)[_-]?", "PA"),
-        (r"[_-](lr)[_-]?", "LR"),
-        (r"[_-](rl)[_-]?", "RL"),
-        (r"[_-](si)[_-]?", "SI"),
-        (r"[_-](is)[_-]?", "IS"),
-    ]
-
-    for pattern, direction in direction_patterns:
-        if re.search(pattern, desc) or re.search(pattern, proto):
-            return direction
+    found = _DIRECTION_PATTERN.findall(_search_text(acq.series_description, acq.protocol_name))
+    if not found:
+        return None
+
+    for code in _DIRECTION_CODES:
+        if code in found:
+            return code.upper()
 
     return None
 
@@ -118,22 +173,17 @@ def extract_acquisition_entity(acq: Acquisition) -> Optional[str]:
     str or None
         Acquisition label or None
     """
-    desc = acq.series_description.lower()
-    proto = acq.protocol_name.lower()
+    desc = _lower(acq.series_description)
+    proto = _lower(acq.protocol_name)
 
-    # Common acquisition label patterns
-    acq_patterns = [
-        r"acq[_-]?(\w+)",
-        r"(highres|lowres|hires|lores)",
-        r"(mb\d+)",  # Multiband
-        r"(norm|prenorm|postnorm)",
-    ]
+    if not _ACQ_ANY.search(_search_text(acq.series_description, acq.protocol_name)):
+        return None
 
-    for pattern in acq_patterns:
-        match = re.search(pattern, desc) or re.search(pattern, proto)
+    for pattern in _ACQ_PATTERNS:
+        match = pattern.search(desc) or pattern.search(proto)
         if match:
             label = match.group(1) if match.lastindex else match.group(0)
-            label = re.sub(r"[^a-zA-Z0-9]", "", label)
+            label = _NON_ALNUM.sub("", label)
             if label:
                 return label
 
@@ -154,19 +204,13 @@ def extract_run_entity(acq: Acquisition) -> Optional[str]:
     str or None
         Run number or None
     """
-    desc = acq.series_description.lower()
-    proto = acq.protocol_name.lower()
-    path = str(acq.nifti_path).lower()
-
-    # Run patterns - be specific to avoid matching other numbers like TI, TE, etc.
-    run_patterns = [
-        r"run[_-]?(\d+)",
-        r"_r(\d+)_",
-    ]
+    desc = _lower(acq.series_description)
+    proto = _lower(acq.protocol_name)
+    path = acq.nifti_path_lower
 
-    for pattern in run_patterns:
+    for pattern in _RUN_PATTERNS:
         for text in [desc, proto, path]:
-            match = re.search(pattern, text)
+            match = pattern.search(text)
             if match:
                 run_num = match.group(1)
                 # Pad to 2 digits
@@ -194,18 +238,12 @@ def extract_echo_entity(acq: Acquisition) -> Optional[str]:
         return str(acq.echo_number)
 
     # Try to extract from description or path
-    desc = acq.series_description.lower()
-    path = str(acq.json_path).lower()
+    desc = _lower(acq.series_description)
+    path = acq.json_path_lower
 
-    echo_patterns = [
-        r"echo[_-]?(\d+)",
-        r"e(\d+)[_-]",
-        r"_e(\d+)",
-    ]
-
-    for pattern in echo_patterns:
+    for pattern in _ECHO_PATTERNS:
         for text in [desc, path]:
-            match = re.search(pattern, text)
+            match = pattern.search(text)
             if match:
                 return match.group(1)
 
@@ -226,9 +264,9 @@ def extract_part_entity(acq: Acquisition) -> Optional[str]:
     str or None
         Part label or None
     """
-    desc = acq.series_description.lower()
-    path = str(acq.json_path).lower()
-    image_type = [x.lower() for x in acq.image_type]
+    desc = _lower(acq.series_description)
+    path = acq.json_path_lower
+    image_type = acq.image_type_lower
 
     # Check ImageType
     if "p" in image_type or "phase" in image_type:
@@ -263,26 +301,91 @@ def extract_reconstruction_entity(acq: Acquisition) -> Optional[str]:
     str or None
         Reconstruction label or None
     """
-    desc = acq.series_description.lower()
-    proto = acq.protocol_name.lower()
+    desc = _lower(acq.series_description)
+    proto = _lower(acq.protocol_name)
 
-    rec_patterns = [
-        r"rec[_-]?(\w+)",
-        r"(moco|nomoco)",
-        r"(nd|filtered)",
-    ]
+    if not _REC_ANY.search(_search_text(acq.series_description, acq.protocol_name)):
+        return None
 
-    for pattern in rec_patterns:
-        match = re.search(pattern, desc) or re.search(pattern, proto)
+    for pattern in _REC_PATTERNS:
+        match = pattern.search(desc) or pattern.search(proto)
         if match:
             label = match.group(1) if match.lastindex else match.group(0)
-            label = re.sub(r"[^a-zA-Z0-9]", "", label)
+            label = _NON_ALNUM.sub("", label)
             if label:
                 return label
 
     return None
 
 
+def extract_acquisition_entities(acq: Acquisition) -> None:
+    """
+    Extract entity labels for one identified acquisition, in place.
+
+    Parameters
+    ----------
+    acq : Acquisition
+        Acquisition whose datatype and suffix are final
+    """
+    if acq.exclude:
+        return
+
+    entities: dict[str, str] = {}
+
+    # Get required entities from schema
+    required = get_required_entities(acq.datatype, acq.suffix)
+
+    # Task entity (required for func)
+    if "task" in required or acq.datatype == "func":
+        task = extract_task_entity(acq)
+        if task:
+            entities["task"] = task
+
+    # Direction entity (required for fmap/epi)
+    if "direction" in required or acq.datatype == "fmap":
+        direction = extract_direction_entity(acq)
+        if direction:
+            entities["direction"] = direction
+
+    # Echo entity (required for multi-echo), extracted once and listed early
+    # only when required
+    echo = extract_echo_entity(acq)
+    if echo and "echo" in required:
+        entities["echo"] = echo
+
+    # Optional entities - always try to extract
+    acq_label = extract_acquisition_entity(acq)
+    if acq_label:
+        entities["acquisition"] = acq_label
+
+    run = extract_run_entity(acq)
+    if run:
+        entities["run"] = run
+
+    # Echo if not required
+    if echo and "echo" not in required:
+        entities["echo"] = echo
+
+    part = extract_part_entity(acq)
+    if part:
+        entities["part"] = part
+
+    rec = extract_reconstruction_entity(acq)
+    if rec:
+        entities["reconstruction"] = rec
+
+    acq.entities = entities
+
+    # Validate entities against schema
+    if acq.datatype and acq.suffix:
+        errors = validate_entities_for_file(acq.datatype, acq.suffix, entities)
+        if errors:
+            # Filter to only show missing required entities as errors
+            missing_required = [e for e in errors if "Missing required" in e]
+            if missing_required:
+                acq.error = "; ".join(missing_required)
+
+
 def extract_entity_labels(acquisitions: list[Acquisition]) -> list[Acquisition]:
     """
     Extract entity labels for all acquisitions.
@@ -298,65 +401,7 @@ def extract_entity_labels(acquisitions: list[Acquisition]) -> list[Acquisition]:
         Updated acquisitions with entities extracted
     """
     for acq in acquisitions:
-        if acq.exclude:
-            continue
-
-        entities: dict[str, str] = {}
-
-        # Get required entities from schema
-        required = get_required_entities(acq.datatype, acq.suffix)
-
-        # Task entity (required for func)
-        if "task" in required or acq.datatype == "func":
-            task = extract_task_entity(acq)
-            if task:
-                entities["task"] = task
-
-        # Direction entity (required for fmap/epi)
-        if "direction" in required or acq.datatype == "fmap":
-            direction = extract_direction_entity(acq)
-            if direction:
-                entities["direction"] = direction
-
-        # Echo entity (required for multi-echo)
-        if "echo" in required:
-            echo = extract_echo_entity(acq)
-            if echo:
-                entities["echo"] = echo
-
-        # Optional entities - always try to extract
-        acq_label = extract_acquisition_entity(acq)
-        if acq_label:
-            entities["acquisition"] = acq_label
-
-        run = extract_run_entity(acq)
-        if run:
-            entities["run"] = run
-
-        # Echo if not already extracted
-        if "echo" not in entities:
-            echo = extract_echo_entity(acq)
-            if echo:
-                entities["echo"] = echo
-
-        part = extract_part_entity(acq)
-        if part:
-            entities["part"] = part
-
-        rec = extract_reconstruction_entity(acq)
-        if rec:
-            entities["reconstruction"] = rec
-
-        acq.entities = entities
-
-        # Validate entities against schema
-        if acq.datatype and acq.suffix:
-            errors = validate_entities_for_file(acq.datatype, acq.suffix, entities)
-            if errors:
-                # Filter to only show missing required entities as errors
-                missing_required = [e for e in errors if "Missing required" in e]
-                if missing_required:
-                    acq.error = "; ".join(missing_required)
+        extract_acquisition_entities(acq)
 
     return acquisitions
 
@@ -375,16 +420,9 @@ def order_entities(entities: dict[str, str]) -> dict[str, str]:
     dict[str, str]
         Ordered entities
     """
-    entity_order = get_entity_order()
-    ordered = {}
-
-    for entity_name in entity_order:
-        if entity_name in entities:
-            ordered[entity_name] = entities[entity_name]
-
-    # Add any remaining entities not in the standard order
-    for key, value in entities.items():
-        if key not in ordered:
-            ordered[key] = value
+    ranks = get_entity_ranks()
+    unranked = len(ranks)
 
-    return ordered
+    # Stable sort: entities not in the standard order keep their relative
+    # order after all the known ones
+    return dict(sorted(entities.items(), key=lambda item: ranks.get(item[0], unranked)))
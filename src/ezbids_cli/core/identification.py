@@ -9,12 +9,14 @@ the BIDS schema. The schema only defines valid combinations, not detection rules
 """
 
 import re
+import sys
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any, Optional
 
 from ezbids_cli.core.models import Acquisition
 from ezbids_cli.schema import validate_suffix_for_datatype
 
-
 # Search terms for different datatypes/suffixes
 SEARCH_TERMS: dict[str, dict[str, list[str]]] = {
     "exclude": {
@@ -79,31 +81,105 @@ SEARCH_TERMS: dict[str, dict[str, list[str]]] = {
 }
 
 
+# SEARCH_TERMS compiled for matching: the term set of each (datatype, suffix)
+# and every distinct term
+_TERM_SETS: dict[tuple[str, str], frozenset[str]] = {
+    (datatype, suffix): frozenset(terms)
+    for datatype, suffixes in SEARCH_TERMS.items()
+    for suffix, terms in suffixes.items()
+}
+_ALL_TERMS = tuple(sorted(set().union(*_TERM_SETS.values())))
+_EXCLUDE_TERMS = _TERM_SETS["exclude", "localizer"] | _TERM_SETS["exclude", "derived"]
+
+
+@lru_cache(maxsize=4096)
+def _find_terms(text: str) -> frozenset[str]:
+    """
+    Return the SEARCH_TERMS terms occurring in an already normalized text.
+
+    Descriptions and protocol names repeat across the acquisitions of a
+    series, so each distinct text is scanned for all terms once and every
+    suffix check afterwards is a set lookup.
+    """
+    return frozenset([term for term in _ALL_TERMS if term in text])
+
+
+def _has_terms(found: frozenset[str], datatype: str, suffix: str) -> bool:
+    """Check whether any search term of datatype/suffix is among the found terms."""
+    return not found.isdisjoint(_TERM_SETS[datatype, suffix])
+
+
+# Anatomical suffixes in order of specificity, with their search terms and
+# any additional check an acquisition matching the terms must pass
+_ANAT_SUFFIX_RULES: tuple[
+    tuple[str, frozenset[str], Optional[Callable[[Acquisition, str], bool]]], ...
+] = tuple(
+    (suffix, _TERM_SETS["anat", suffix], accepts)
+    for suffix, accepts in (
+        # MP2RAGE requires InversionTime
+        ("MP2RAGE", lambda acq, desc: "InversionTime" in acq.sidecar),
+        # UNIT1 should have UNI in ImageType
+        ("UNIT1", lambda acq, desc: "UNI" in acq.image_type),
+        # Multi-echo GRE/SE require echo number
+        ("MEGRE", lambda acq, desc: acq.echo_number is not None),
+        ("MESE", lambda acq, desc: acq.echo_number is not None),
+        ("T1map", None),
+        ("T2map", None),
+        ("T2starmap", None),
+        ("PDmap", None),
+        ("Chimap", None),
+        # Exclude if MP2RAGE-related terms present
+        ("T1w", lambda acq, desc: not any(x in desc for x in ("inv1", "inv2", "uni_images"))),
+        # T2w typically has longer echo time
+        ("T2w", lambda acq, desc: not (acq.echo_time > 0 and acq.echo_time < 50)),
+        ("FLAIR", None),
+        ("T2starw", None),
+        ("PDw", None),
+        ("inplaneT1", None),
+        ("inplaneT2", None),
+        ("angio", None),
+    )
+    if ("anat", suffix) in _TERM_SETS
+)
+
+
+# Terms indicating a GRE fieldmap, outside of SEARCH_TERMS
+_GRE_FMAP_PATTERN = re.compile("fieldmap|gre")
+
+# ImageType values that rule out functional data
+_FUNC_EXCLUDED_IMAGE_TYPES = frozenset({"DERIVED", "PERFUSION", "DIFFUSION", "ASL", "UNI"})
+
+
+@lru_cache(maxsize=4096)
 def _normalize_description(text: str) -> str:
-    """Normalize series description for matching."""
+    """Normalize series description for matching (memoized, as descriptions repeat)."""
     return text.lower().replace(" ", "_").replace("-", "_")
 
 
-def _check_search_terms(description: str, terms: list[str]) -> bool:
-    """Check if any search terms match the description."""
-    desc_normalized = _normalize_description(description)
-    return any(term in desc_normalized for term in terms)
+@lru_cache(maxsize=4096)
+def _description_terms(series_description: str, protocol_name: str) -> frozenset[str]:
+    """Return the search terms found in a description or protocol name, memoized per pair."""
+    return _find_terms(_normalize_description(series_description)) | _find_terms(
+        _normalize_description(protocol_name)
+    )
 
 
 def _should_exclude(acq: Acquisition) -> tuple[bool, Optional[str]]:
     """Check if acquisition should be excluded."""
-    desc = _normalize_description(acq.series_description)
-    proto = _normalize_description(acq.protocol_name)
+    found = _description_terms(acq.series_description, acq.protocol_name)
 
-    # Check localizer patterns
-    for term in SEARCH_TERMS["exclude"]["localizer"]:
-        if term in desc or term in proto:
-            return True, f"Excluded: matches localizer pattern '{term}'"
+    # Most acquisitions match no exclusion term at all; only otherwise find
+    # the first matching term (in list order) for the message
+    if not found.isdisjoint(_EXCLUDE_TERMS):
+        # Check localizer patterns
+        for term in SEARCH_TERMS["exclude"]["localizer"]:
+            if term in found:
+                return True, f"Excluded: matches localizer pattern '{term}'"
 
-    # Check derived image patterns
-    for term in SEARCH_TERMS["exclude"]["derived"]:
-        if term in desc or term in proto:
-            return True, f"Excluded: matches derived image pattern '{term}'"
+        # Check derived image patterns
+        for term in SEARCH_TERMS["exclude"]["derived"]:
+            if term in found:
+                return True, f"Excluded: matches derived image pattern '{term}'"
 
     # Check for localizer indicator in path
     if "_i0000" in str(acq.nifti_path):
@@ -114,53 +190,15 @@ def _should_exclude(acq: Acquisition) -> tuple[bool, Optional[str]]:
 
 def identify_anat(acq: Acquisition) -> tuple[Optional[str], Optional[str]]:
     """Identify anatomical datatype and suffix."""
-    desc = _normalize_description(acq.series_description)
-    proto = _normalize_description(acq.protocol_name)
-
     # Must be 3D
     if acq.ndim != 3:
         return None, None
 
-    # Check for specific suffixes in order of specificity
-    suffix_order = [
-        "MP2RAGE", "UNIT1", "MEGRE", "MESE",
-        "T1map", "T2map", "T2starmap", "PDmap", "Chimap",
-        "T1w", "T2w", "FLAIR", "T2starw", "PDw",
-        "inplaneT1", "inplaneT2", "angio",
-    ]
-
-    for suffix in suffix_order:
-        if suffix not in SEARCH_TERMS["anat"]:
-            continue
-
-        terms = SEARCH_TERMS["anat"][suffix]
-        if _check_search_terms(desc, terms) or _check_search_terms(proto, terms):
-            # Additional checks for certain suffixes
-            if suffix == "T1w":
-                # Exclude if MP2RAGE-related terms present
-                if any(x in desc for x in ["inv1", "inv2", "uni_images"]):
-                    continue
-            elif suffix == "T2w":
-                # T2w typically has longer echo time
-                if acq.echo_time > 0 and acq.echo_time < 50:
-                    continue
-            elif suffix == "MEGRE":
-                # Multi-echo GRE requires echo number
-                if acq.echo_number is None:
-                    continue
-            elif suffix == "MESE":
-                # Multi-echo SE requires echo number
-                if acq.echo_number is None:
-                    continue
-            elif suffix == "UNIT1":
-                # UNIT1 should have UNI in ImageType
-                if "UNI" not in acq.image_type:
-                    continue
-            elif suffix == "MP2RAGE":
-                # MP2RAGE requires InversionTime
-                if "InversionTime" not in acq.sidecar:
-                    continue
+    desc = _normalize_description(acq.series_description)
+    found = _description_terms(acq.series_description, acq.protocol_name)
 
+    for suffix, terms, accepts in _ANAT_SUFFIX_RULES:
+        if not found.isdisjoint(terms) and (accepts is None or accepts(acq, desc)):
             return "anat", suffix
 
     return None, None
@@ -168,25 +206,26 @@ def identify_anat(acq: Acquisition) -> tuple[Optional[str], Optional[str]]:
 
 def identify_func(acq: Acquisition) -> tuple[Optional[str], Optional[str]]:
     """Identify functional datatype and suffix."""
-    desc = _normalize_description(acq.series_description)
-    proto = _normalize_description(acq.protocol_name)
+    # BOLD should be 4D with multiple volumes, SBRef is 3D with single volume;
+    # these shape checks are cheaper than any term lookup, so they go first
+    is_bold_shape = acq.ndim == 4 and acq.num_volumes > 1 and acq.repetition_time > 0
+    is_sbref_shape = acq.ndim == 3 and acq.num_volumes == 1
+    if not (is_bold_shape or is_sbref_shape):
+        return None, None
 
     # Check for exclusion patterns in ImageType
-    excluded_types = ["DERIVED", "PERFUSION", "DIFFUSION", "ASL", "UNI"]
-    if any(x in acq.image_type for x in excluded_types):
+    if not _FUNC_EXCLUDED_IMAGE_TYPES.isdisjoint(acq.image_type):
         return None, None
 
     # Check for bold
-    if _check_search_terms(desc, SEARCH_TERMS["func"]["bold"]) or \
-       _check_search_terms(proto, SEARCH_TERMS["func"]["bold"]):
-
-        # BOLD should be 4D with multiple volumes
-        if acq.ndim == 4 and acq.num_volumes > 1 and acq.repetition_time > 0:
+    found = _description_terms(acq.series_description, acq.protocol_name)
+    if _has_terms(found, "func", "bold"):
+        if is_bold_shape:
             return "func", "bold"
 
-        # SBRef is 3D with single volume
-        if acq.ndim == 3 and acq.num_volumes == 1:
-            if _check_search_terms(desc, SEARCH_TERMS["func"]["sbref"]):
+        if is_sbref_shape:
+            desc = _normalize_description(acq.series_description)
+            if _has_terms(_find_terms(desc), "func", "sbref"):
                 return "func", "sbref"
 
     return None, None
@@ -194,8 +233,14 @@ def identify_func(acq: Acquisition) -> tuple[Optional[str], Optional[str]]:
 
 def identify_dwi(acq: Acquisition) -> tuple[Optional[str], Optional[str]]:
     """Identify diffusion datatype and suffix."""
+    # DWI should have multiple volumes, SBRef or B0 a single 3D volume;
+    # checked before the description, as the numbers are cheaper to test
+    is_multi_volume = acq.num_volumes > 1
+    is_single_volume = acq.ndim == 3 and acq.num_volumes == 1
+    if not (is_multi_volume or is_single_volume):
+        return None, None
+
     desc = _normalize_description(acq.series_description)
-    proto = _normalize_description(acq.protocol_name)
 
     # Check for derived images
     if any(x in desc for x in ["trace", "_fa_", "adc"]):
@@ -204,16 +249,16 @@ def identify_dwi(acq: Acquisition) -> tuple[Optional[str], Optional[str]]:
     # Check if bvec file exists
     has_bvec = any(str(p).endswith(".bvec") for p in acq.paths)
 
-    if _check_search_terms(desc, SEARCH_TERMS["dwi"]["dwi"]) or \
-       _check_search_terms(proto, SEARCH_TERMS["dwi"]["dwi"]) or has_bvec:
+    found = _description_terms(acq.series_description, acq.protocol_name)
+    if has_bvec or _has_terms(found, "dwi", "dwi"):
 
         # DWI should have multiple volumes or bvec
-        if has_bvec and acq.num_volumes > 1:
+        if has_bvec and is_multi_volume:
             return "dwi", "dwi"
 
         # SBRef or B0
-        if acq.ndim == 3 and acq.num_volumes == 1:
-            if _check_search_terms(desc, SEARCH_TERMS["dwi"]["sbref"]):
+        if is_single_volume:
+            if _has_terms(_find_terms(desc), "dwi", "sbref"):
                 return "dwi", "sbref"
 
     return None, None
@@ -223,20 +268,18 @@ def identify_fmap(acq: Acquisition) -> tuple[Optional[str], Optional[str]]:
     """Identify fieldmap datatype and suffix."""
     desc = _normalize_description(acq.series_description)
     proto = _normalize_description(acq.protocol_name)
-    json_path = str(acq.json_path).lower()
+    json_path = acq.json_path_lower
     manufacturer = acq.sidecar.get("Manufacturer", "").upper()
 
-    # Check for EPI fieldmaps (spin echo, PEPOLAR)
-    if _check_search_terms(desc, SEARCH_TERMS["fmap"]["epi"]) or \
-       _check_search_terms(proto, SEARCH_TERMS["fmap"]["epi"]):
-        # EPI fmaps typically have few volumes
-        if acq.num_volumes <= 10 and acq.echo_number is None:
-            if manufacturer != "GE":
-                return "fmap", "epi"
+    # Check for EPI fieldmaps (spin echo, PEPOLAR), which typically have few
+    # volumes; the numbers are tested before the search terms
+    if acq.num_volumes <= 10 and acq.echo_number is None and manufacturer != "GE":
+        found = _description_terms(acq.series_description, acq.protocol_name)
+        if _has_terms(found, "fmap", "epi"):
+            return "fmap", "epi"
 
     # Check for GRE fieldmaps
-    is_gre_fmap = _check_search_terms(desc, ["fieldmap", "gre"]) or \
-                  _check_search_terms(proto, ["fieldmap", "gre"])
+    is_gre_fmap = bool(_GRE_FMAP_PATTERN.search(desc) or _GRE_FMAP_PATTERN.search(proto))
 
     if is_gre_fmap or acq.echo_number is not None:
         # Check echo number for multi-echo GRE fieldmaps
@@ -304,17 +347,20 @@ def identify_acquisition(acq: Acquisition) -> Acquisition:
     if datatype and suffix:
         # Validate against schema
         is_valid, error = validate_suffix_for_datatype(datatype, suffix)
+        # Interned, as a handful of types and messages repeat across the dataset
         if is_valid:
             acq.datatype = datatype
             acq.suffix = suffix
-            acq.type = f"{datatype}/{suffix}"
-            acq.message = f"Identified as {datatype}/{suffix}"
+            acq.type = sys.intern(f"{datatype}/{suffix}")
+            acq.message = sys.intern(f"Identified as {datatype}/{suffix}")
         else:
             # Heuristics found something but schema doesn't recognize it
             acq.datatype = datatype
             acq.suffix = suffix
-            acq.type = f"{datatype}/{suffix}"
-            acq.message = f"Identified as {datatype}/{suffix} (validation warning: {error})"
+            acq.type = sys.intern(f"{datatype}/{suffix}")
+            acq.message = sys.intern(
+                f"Identified as {datatype}/{suffix} (validation warning: {error})"
+            )
     else:
         # Unknown - don't exclude, but mark as unidentified
         acq.type = ""
@@ -324,7 +370,10 @@ def identify_acquisition(acq: Acquisition) -> Acquisition:
     return acq
 
 
-def identify_all_acquisitions(acquisitions: list[Acquisition]) -> list[Acquisition]:
+def identify_all_acquisitions(
+    acquisitions: list[Acquisition],
+    on_identified: Optional[Callable[[Acquisition], None]] = None,
+) -> list[Acquisition]:
     """
     Identify datatype and suffix for all acquisitions.
 
@@ -332,21 +381,48 @@ def identify_all_acquisitions(acquisitions: list[Acquisition]) -> list[Acquisiti
     ----------
     acquisitions : list[Acquisition]
         List of acquisitions to identify
+    on_identified : callable, optional
+        Called once per acquisition as soon as its identification is final,
+        so per-acquisition follow-up work (such as entity extraction) can
+        run in the same pass. Acquisitions that post-processing may still
+        reclassify are handed over after it.
 
     Returns
     -------
     list[Acquisition]
         Updated acquisitions with identification results
     """
+    deferred: list[Acquisition] = []
+
     for acq in acquisitions:
         identify_acquisition(acq)
+        if on_identified is not None:
+            if _may_be_b0map(acq):
+                deferred.append(acq)
+            else:
+                on_identified(acq)
 
     # Post-processing: Check for DWI b0 maps that should be fmap/epi
     _check_dwi_b0maps(acquisitions)
 
+    if on_identified is not None:
+        for acq in deferred:
+            on_identified(acq)
+
     return acquisitions
 
 
+def _may_be_b0map(acq: Acquisition) -> bool:
+    """Check whether a DWI acquisition is a candidate for reclassification as fmap/epi."""
+    # Very few volumes and a direction entity
+    return (
+        acq.datatype == "dwi"
+        and acq.suffix == "dwi"
+        and acq.num_volumes < 10
+        and bool(acq.direction)
+    )
+
+
 def _check_dwi_b0maps(acquisitions: list[Acquisition]) -> None:
     """
     Check for DWI sequences that are actually B0 fieldmaps.
@@ -354,18 +430,19 @@ def _check_dwi_b0maps(acquisitions: list[Acquisition]) -> None:
     DWI sequences with very few volumes (<10) and no actual diffusion
     weighting might be intended as fieldmaps.
     """
+    # Only reclassify if there are other DWI sequences with more volumes.
+    # Checked once up front: reclassification below only ever touches
+    # low-volume sequences, so the answer cannot change during the pass.
+    has_full_dwi = any(
+        a.datatype == "dwi" and a.suffix == "dwi" and a.num_volumes > 10
+        for a in acquisitions
+    )
+    if not has_full_dwi:
+        return
+
     for acq in acquisitions:
-        if acq.datatype == "dwi" and acq.suffix == "dwi":
-            # If very few volumes and has direction entity, might be fmap
-            if acq.num_volumes < 10 and acq.direction:
-                # Check if there are other DWI sequences with more volumes
-                other_dwi = [
-                    a for a in acquisitions
-                    if a.datatype == "dwi" and a.suffix == "dwi"
-                    and a.num_volumes > 10 and a is not acq
-                ]
-                if other_dwi:
-                    acq.datatype = "fmap"
-                    acq.suffix = "epi"
-                    acq.type = "fmap/epi"
-                    acq.message = "Reclassified from dwi to fmap/epi (low volume count)"
+        if _may_be_b0map(acq):
+            acq.datatype = "fmap"
+            acq.suffix = "epi"
+            acq.type = "fmap/epi"
+            acq.message = "Reclassified from dwi to fmap/epi (low volume count)"
@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import Any, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Acquisition:
     """Represents a single imaging acquisition (NIfTI file with metadata)."""
 
@@ -63,7 +63,8 @@ class Acquisition:
     datatype: str = ""
     suffix: str = ""
     type: str = ""  # "datatype/suffix" or "exclude"
-    entities: dict[str, str] = field(default_factory=dict)
+    # None until entity extraction assigns the acquisition its own dict
+    entities: Optional[dict[str, str]] = None
 
     # Field map relationships
     intended_for: Optional[list[int]] = None
@@ -81,16 +82,56 @@ class Acquisition:
     sidecar: dict[str, Any] = field(default_factory=dict)
     headers: str = ""
 
+    # Lowercased paths and ImageType values, memoized with the value they
+    # were derived from so reassigning the source field refreshes them
+    _nifti_path_lower: tuple[Any, str] = field(
+        default=(None, ""), init=False, repr=False, compare=False
+    )
+    _json_path_lower: tuple[Any, str] = field(
+        default=(None, ""), init=False, repr=False, compare=False
+    )
+    _image_type_lower: tuple[Optional[list[str]], frozenset[str]] = field(
+        default=(None, frozenset()), init=False, repr=False, compare=False
+    )
+
     def __post_init__(self) -> None:
         """Ensure paths are Path objects."""
         if isinstance(self.nifti_path, str):
             self.nifti_path = Path(self.nifti_path)
         if isinstance(self.json_path, str):
             self.json_path = Path(self.json_path)
-        self.paths = [Path(p) if isinstance(p, str) else p for p in self.paths]
-
-
-@dataclass
+        if any(isinstance(p, str) for p in self.paths):
+            self.paths = [Path(p) if isinstance(p, str) else p for p in self.paths]
+
+    @property
+    def nifti_path_lower(self) -> str:
+        """Lowercased ``nifti_path``, matched against by identification heuristics."""
+        source, lowered = self._nifti_path_lower
+        if source is not self.nifti_path:
+            lowered = str(self.nifti_path).lower()
+            self._nifti_path_lower = (self.nifti_path, lowered)
+        return lowered
+
+    @property
+    def json_path_lower(self) -> str:
+        """Lowercased ``json_path``, matched against by identification heuristics."""
+        source, lowered = self._json_path_lower
+        if source is not self.json_path:
+            lowered = str(self.json_path).lower()
+            self._json_path_lower = (self.json_path, lowered)
+        return lowered
+
+    @property
+    def image_type_lower(self) -> frozenset[str]:
+        """Lowercased ``image_type`` values; also refreshed after in-place edits."""
+        source, lowered = self._image_type_lower
+        if source != self.image_type:
+            lowered = frozenset(x.lower() for x in self.image_type)
+            self._image_type_lower = (list(self.image_type), lowered)
+        return lowered
+
+
+@dataclass(slots=True)
 class Subject:
     """Represents a subject in the dataset."""
 
@@ -99,7 +140,7 @@ class Subject:
     sessions: list["Session"] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """Represents a session within a subject."""
 
@@ -108,7 +149,7 @@ class Session:
     acquisition_time: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Series:
     """Represents a unique series (acquisition type) in the dataset."""
 
@@ -141,7 +182,7 @@ class Series:
     object_indices: list[int] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DatasetDescription:
     """BIDS dataset_description.json content."""
 
@@ -170,7 +211,7 @@ class DatasetDescription:
             ]
 
 
-@dataclass
+@dataclass(slots=True)
 class ParticipantInfo:
     """Participant phenotype information."""
 
@@ -180,7 +221,7 @@ class ParticipantInfo:
     handedness: str = "n/a"
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Complete analysis result for a dataset."""
 
@@ -1,16 +1,28 @@
 """dcm2niix wrapper for DICOM to NIfTI conversion."""
 
+import os
 import subprocess
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import IO, Optional
 
-from rich.console import Console
+from ezbids_cli._console import get_console
 
-console = Console()
+console = get_console()
 
 
+@lru_cache(maxsize=1)
 def find_dcm2niix() -> Optional[str]:
-    """Find dcm2niix executable."""
+    """Find dcm2niix executable.
+
+    The result is cached for the lifetime of the process; call
+    ``find_dcm2niix.cache_clear()`` after changing PATH.
+    """
     import shutil
 
     # First try shutil.which (respects PATH)
@@ -26,7 +38,7 @@ def find_dcm2niix() -> Optional[str]:
     ]
 
     for p in common_paths:
-        if Path(p).exists():
+        if os.path.isfile(p):
             return p
 
     return None
@@ -37,6 +49,75 @@ def check_dcm2niix() -> bool:
     return find_dcm2niix() is not None
 
 
+# Lines of dcm2niix output kept per stream for the result and error reports
+_MAX_LOG_LINES = 5000
+
+
+# How often a run with a stall timeout checks for new output, in seconds
+_WATCHDOG_INTERVAL = 1.0
+
+
+class _StalledError(subprocess.TimeoutExpired):
+    """dcm2niix went longer than the stall timeout without writing any output."""
+
+
+def _read_stream(
+    stream: IO[bytes],
+    lines: deque[bytes],
+    style: Optional[str],
+    progress: threading.Event,
+) -> None:
+    """
+    Collect raw lines from a subprocess stream, echoing them in style if given.
+
+    The stream is always drained to EOF, so dcm2niix never blocks on a full
+    pipe; if echoing fails, the remaining lines are only collected.
+    """
+    from rich.markup import escape
+
+    with stream:
+        for line in stream:
+            lines.append(line)
+            progress.set()
+            if style:
+                text = escape(line.decode("utf-8", errors="replace").rstrip())
+                try:
+                    console.print(f"[{style}]{text}[/]")
+                except Exception:
+                    style = None
+
+
+def _wait_with_watchdog(
+    proc: subprocess.Popen,
+    timeout: float,
+    stall_timeout: float,
+    progress: threading.Event,
+) -> int:
+    """
+    Wait for proc, giving up on the overall timeout or when output stalls.
+
+    Raises
+    ------
+    subprocess.TimeoutExpired
+        If proc is still running after timeout seconds
+    _StalledError
+        If proc wrote nothing for stall_timeout seconds
+    """
+    start = last_output = time.monotonic()
+    while True:
+        try:
+            return proc.wait(timeout=_WATCHDOG_INTERVAL)
+        except subprocess.TimeoutExpired:
+            now = time.monotonic()
+            if progress.is_set():
+                progress.clear()
+                last_output = now
+            if now - start >= timeout:
+                raise subprocess.TimeoutExpired(proc.args, timeout) from None
+            if now - last_output >= stall_timeout:
+                raise _StalledError(proc.args, stall_timeout) from None
+
+
 def run_dcm2niix(
     input_dir: Path,
     output_dir: Path,
@@ -44,6 +125,7 @@ def run_dcm2niix(
     compress: bool = True,
     verbose: bool = False,
     timeout: int = 3600,
+    stall_timeout: Optional[int] = None,
 ) -> dict:
     """
     Run dcm2niix to convert DICOM to NIfTI.
@@ -62,6 +144,9 @@ def run_dcm2niix(
         Show detailed output
     timeout : int
         Timeout in seconds
+    stall_timeout : int, optional
+        Stop dcm2niix once it has written no output for this many seconds,
+        however much of the overall timeout is left (default: no limit)
 
     Returns
     -------
@@ -98,34 +183,95 @@ def run_dcm2niix(
     console.print(f"[dim]Running: {' '.join(cmd)}[/]")
 
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
         )
 
-        # Find output files
-        nifti_files = list(output_dir.glob("*.nii.gz")) + list(output_dir.glob("*.nii"))
-        json_files = list(output_dir.glob("*.json"))
-
-        success = result.returncode == 0 and len(nifti_files) > 0
-
-        if verbose or not success:
-            if result.stdout:
-                console.print(f"[dim]{result.stdout}[/]")
-            if result.stderr:
-                console.print(f"[yellow]{result.stderr}[/]")
+        # Keep only the tail of each stream, so verbose runs over large
+        # series do not hold the whole log in memory
+        stdout_lines: deque[bytes] = deque(maxlen=_MAX_LOG_LINES)
+        stderr_lines: deque[bytes] = deque(maxlen=_MAX_LOG_LINES)
+        progress = threading.Event()
+        readers = [
+            threading.Thread(
+                target=_read_stream,
+                args=(proc.stdout, stdout_lines, "dim" if verbose else None, progress),
+                daemon=True,
+            ),
+            threading.Thread(
+                target=_read_stream,
+                args=(proc.stderr, stderr_lines, "yellow" if verbose else None, progress),
+                daemon=True,
+            ),
+        ]
+        for reader in readers:
+            reader.start()
+
+        try:
+            if stall_timeout is None:
+                returncode = proc.wait(timeout=timeout)
+            else:
+                returncode = _wait_with_watchdog(proc, timeout, stall_timeout, progress)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            for reader in readers:
+                reader.join()
+
+        # Only the kept tail is decoded; dcm2niix echoes DICOM header text,
+        # which is not always valid UTF-8
+        stdout = b"".join(stdout_lines).decode("utf-8", errors="replace")
+        stderr = b"".join(stderr_lines).decode("utf-8", errors="replace")
+
+        # Find output files in one listing
+        gz_files: list[Path] = []
+        nii_files: list[Path] = []
+        json_files: list[Path] = []
+        with os.scandir(output_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.endswith(".nii.gz"):
+                    gz_files.append(Path(entry.path))
+                elif name.endswith(".nii"):
+                    nii_files.append(Path(entry.path))
+                elif name.endswith(".json"):
+                    json_files.append(Path(entry.path))
+        nifti_files = gz_files + nii_files
+
+        success = returncode == 0 and len(nifti_files) > 0
+
+        # Verbose runs were already echoed line by line; the output is escaped
+        # so brackets in it are not read as markup
+        if not success and not verbose:
+            from rich.markup import escape
+
+            if stdout:
+                console.print(f"[dim]{escape(stdout)}[/]")
+            if stderr:
+                console.print(f"[yellow]{escape(stderr)}[/]")
 
         return {
             "success": success,
-            "returncode": result.returncode,
+            "returncode": returncode,
             "output_files": nifti_files,
             "json_files": json_files,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
+            "stdout": stdout,
+            "stderr": stderr,
         }
 
+    except _StalledError:
+        return {
+            "success": False,
+            "returncode": -1,
+            "output_files": [],
+            "json_files": [],
+            "stdout": "",
+            "stderr": f"dcm2niix stalled: no output for {stall_timeout} seconds",
+        }
     except subprocess.TimeoutExpired:
         return {
             "success": False,
@@ -146,45 +292,175 @@ def run_dcm2niix(
         }
 
 
-def is_dicom_directory(path: Path) -> bool:
+# Common DICOM file extensions, matched case-insensitively
+_DICOM_EXTENSIONS = (".dcm", ".ima")
+
+# Suffix-less files checked for DICOM magic bytes per walked tree
+_MAX_MAGIC_PROBES = 50
+
+# Positioned reads are unavailable on Windows
+_HAS_PREAD = hasattr(os, "pread")
+
+
+def _walk_entries(root: str) -> Iterator[os.DirEntry]:
+    """
+    Yield the entries under root, one directory listing at a time.
+
+    Directories are visited in the same order as ``Path.rglob``: each
+    directory's entries come before those of its subdirectories, and
+    symlinked directories are not followed. Unreadable directories are
+    skipped. Entries carry their cached type, so callers need no extra stat.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    yield from entries
+
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            continue
+        if is_dir:
+            yield from _walk_entries(entry.path)
+
+
+def is_dicom_directory(path: Path, jobs: Optional[int] = None) -> bool:
     """
     Check if a directory contains DICOM files.
 
+    Each top-level subdirectory is walked once, in parallel threads, and
+    the probe stops as soon as any of them turns up a DICOM file.
+
     Parameters
     ----------
     path : Path
         Directory to check
+    jobs : int, optional
+        Number of subdirectories walked concurrently (default: up to 8).
+        Use 1 on network filesystems where parallel walks are slower.
 
     Returns
     -------
     bool
         True if DICOM files found
     """
-    # Common DICOM file patterns
-    dicom_patterns = ["*.dcm", "*.DCM", "*.ima", "*.IMA"]
+    if jobs is None:
+        jobs = min(8, os.cpu_count() or 4)
+
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return False
+
+    if _has_dicom_entry(entries):
+        return True
+
+    subdirs = []
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+        except OSError:
+            continue
+
+    if jobs <= 1 or len(subdirs) < 2:
+        return any(_has_dicom_entry(_walk_entries(subdir)) for subdir in subdirs)
+
+    # Walking is I/O-bound, so threads overlap the directory reads; once one
+    # subtree has a DICOM file the others stop at their next entry
+    stop = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=min(jobs, len(subdirs)))
+    try:
+        futures = [
+            executor.submit(_has_dicom_entry, _walk_entries(subdir), stop) for subdir in subdirs
+        ]
+        return any(future.result() for future in as_completed(futures))
+    finally:
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _has_dicom_entry(
+    entries: Iterable[os.DirEntry], stop: Optional[threading.Event] = None
+) -> bool:
+    """
+    Check entries for a DICOM file name, or DICOM magic bytes in a suffix-less file.
+
+    Stops early, returning False, once stop is set.
+    """
+    # DICOM files often have no extension; up to _MAX_MAGIC_PROBES such
+    # files are checked for the DICOM magic bytes
+    probes_left = _MAX_MAGIC_PROBES
+
+    for entry in entries:
+        if stop is not None and stop.is_set():
+            return False
 
-    for pattern in dicom_patterns:
-        if list(path.rglob(pattern)):
+        name = entry.name
+        if name.lower().endswith(_DICOM_EXTENSIONS):
             return True
 
-    # Check for files without extension that might be DICOM
-    # DICOM files often have no extension
-    for f in path.rglob("*"):
-        if f.is_file() and not f.suffix:
-            # Quick check for DICOM magic bytes
-            try:
-                with open(f, "rb") as fp:
-                    fp.seek(128)
-                    magic = fp.read(4)
-                    if magic == b"DICM":
-                        return True
-            except (IOError, OSError):
-                pass
-            break  # Only check first file
+        if not probes_left:
+            continue
+        dot = name.rfind(".")
+        if 0 < dot < len(name) - 1:
+            continue  # has a suffix
+        try:
+            if not entry.is_file():
+                continue
+        except OSError:
+            continue
+
+        probes_left -= 1
+        if _has_dicm_magic(entry.path):
+            return True
 
     return False
 
 
+def _has_dicm_magic(path: str) -> bool:
+    """Check for the "DICM" marker that follows the 128-byte DICOM preamble."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return False
+    try:
+        if _HAS_PREAD:
+            magic = os.pread(fd, 4, 128)
+        else:
+            os.lseek(fd, 128, os.SEEK_SET)
+            magic = os.read(fd, 4)
+        return magic == b"DICM"
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
+
+
+def count_nifti_files(path: Path) -> int:
+    """
+    Count the NIfTI files under a directory.
+
+    Parameters
+    ----------
+    path : Path
+        Directory to check
+
+    Returns
+    -------
+    int
+        Number of .nii and .nii.gz files found
+    """
+    return sum(
+        1 for entry in _walk_entries(str(path)) if entry.name.endswith((".nii.gz", ".nii"))
+    )
+
+
 def preprocess_input(
     input_dir: Path,
     work_dir: Path,
@@ -208,9 +484,9 @@ def preprocess_input(
         (Path to NIfTI files, whether preprocessing was run)
     """
     # Check if already has NIfTI files
-    nifti_files = list(input_dir.rglob("*.nii.gz")) + list(input_dir.rglob("*.nii"))
-    if nifti_files:
-        console.print(f"[dim]Found {len(nifti_files)} NIfTI files[/]")
+    num_nifti = count_nifti_files(input_dir)
+    if num_nifti:
+        console.print(f"[dim]Found {num_nifti} NIfTI files[/]")
         return input_dir, False
 
     # Check for DICOM
@@ -229,7 +505,9 @@ def preprocess_input(
             console.print(f"[green]Converted {len(result['output_files'])} files[/]")
             return nifti_dir, True
         else:
-            console.print(f"[red]dcm2niix failed: {result['stderr']}[/]")
+            from rich.markup import escape
+
+            console.print(f"[red]dcm2niix failed: {escape(result['stderr'])}[/]")
             return input_dir, False
 
     console.print("[yellow]No DICOM or NIfTI files found in input directory[/]")
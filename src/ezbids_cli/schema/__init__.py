@@ -5,6 +5,8 @@ All schema data (datatypes, suffixes, entities, ordering) comes from the
 official BIDS specification.
 """
 
+from collections.abc import Mapping
+
 from ezbids_cli.schema._bst_adapter import (
     BIDSSchemaAdapter,
     EntityInfo,
@@ -51,8 +53,17 @@ def get_entity_short_key(entity_name: str) -> str:
 
 def build_entity_mapping() -> dict[str, str]:
     """Build mapping from full entity names to short keys."""
-    entities = get_schema_adapter().get_entities()
-    return {name: info.short_key for name, info in entities.items()}
+    return get_schema_adapter().get_entity_mapping()
+
+
+def get_entity_ranks() -> Mapping[str, int]:
+    """Return the position of each entity in the canonical order (read-only)."""
+    return get_schema_adapter().get_entity_ranks()
+
+
+def get_entity_filename_keys() -> Mapping[str, tuple[int, str]]:
+    """Return ``entity_name -> (position, short_key)`` in canonical order (read-only)."""
+    return get_schema_adapter().get_entity_filename_keys()
 
 
 def get_suffixes() -> dict[str, SuffixInfo]:
@@ -92,7 +103,9 @@ __all__ = [
     "get_datatypes",
     "get_entities",
     "get_entities_for_suffix",
+    "get_entity_filename_keys",
     "get_entity_order",
+    "get_entity_ranks",
     "get_entity_short_key",
     "get_file_rules",
     "get_suffixes",
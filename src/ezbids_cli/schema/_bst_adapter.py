@@ -4,11 +4,12 @@ This module wraps bidsschematools to provide a stable internal API
 for accessing BIDS schema information.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import cached_property
+from types import MappingProxyType
 from typing import Any
 
-from bidsschematools import schema as bst_schema
-
 
 @dataclass
 class EntityInfo:
@@ -51,9 +52,17 @@ class BIDSSchemaAdapter:
             Specific BIDS version to use. If None, uses latest bundled version.
             Note: Version pinning requires the version to be available in bidsschematools.
         """
+        from bidsschematools import schema as bst_schema
+
         self._version = version
         self._schema = bst_schema.load_schema()
 
+        # Per-datatype and per-suffix tables, filled on first lookup
+        self._file_rules: dict[str, dict[str, FileRule]] = {}
+        self._suffixes_for_datatype: dict[str, tuple[str, ...]] = {}
+        self._entities_for_suffix: dict[tuple[str, str], dict[str, str]] = {}
+        self._entities_at_level: dict[tuple[str, str, str], tuple[str, ...]] = {}
+
     @property
     def bids_version(self) -> str:
         """Return the BIDS version from the schema."""
@@ -64,59 +73,127 @@ class BIDSSchemaAdapter:
         """Return the schema version."""
         return str(self._schema.get("schema_version", "unknown"))
 
+    @cached_property
+    def _entity_order(self) -> tuple[str, ...]:
+        """Canonical entity order, read from the schema once."""
+        return tuple(self._schema.rules.entities)
+
+    @cached_property
+    def _entity_short_keys(self) -> dict[str, str]:
+        """Mapping from full entity names to short keys, read once."""
+        return {
+            entity_name: entity_obj.get("name", entity_name[:3])
+            for entity_name, entity_obj in self._schema.objects.entities.items()
+        }
+
+    @cached_property
+    def _entity_ranks(self) -> dict[str, int]:
+        """Position of each entity in the canonical order, built once."""
+        return {name: rank for rank, name in enumerate(self._entity_order)}
+
+    @cached_property
+    def _entity_filename_keys(self) -> dict[str, tuple[int, str]]:
+        """``entity_name -> (position, short_key)`` in canonical order, built once."""
+        short_keys = self._entity_short_keys
+        return {
+            name: (rank, short_keys.get(name, name[:3]))
+            for rank, name in enumerate(self._entity_order)
+        }
+
     def get_entity_order(self) -> list[str]:
         """Return the canonical order of BIDS entities for filenames."""
-        return list(self._schema.rules.entities)
+        return list(self._entity_order)
 
-    def get_entities(self) -> dict[str, EntityInfo]:
-        """Return all entity definitions."""
-        result = {}
-        for entity_name, entity_obj in self._schema.objects.entities.items():
-            result[entity_name] = EntityInfo(
+    def get_entity_mapping(self) -> dict[str, str]:
+        """Return a mapping from full entity names to short keys."""
+        return dict(self._entity_short_keys)
+
+    def get_entity_ranks(self) -> Mapping[str, int]:
+        """
+        Return the position of each entity in the canonical order.
+
+        The result is a read-only view of a table built once per adapter.
+        """
+        return MappingProxyType(self._entity_ranks)
+
+    def get_entity_filename_keys(self) -> Mapping[str, tuple[int, str]]:
+        """
+        Return ``entity_name -> (position, short_key)`` for building filenames.
+
+        The result is a read-only view of a table built once per adapter,
+        for callers that look entities up per file.
+        """
+        return MappingProxyType(self._entity_filename_keys)
+
+    @cached_property
+    def _entities(self) -> dict[str, EntityInfo]:
+        """Entity definitions, read from the schema once."""
+        return {
+            entity_name: EntityInfo(
                 name=entity_name,
                 short_key=entity_obj.get("name", entity_name[:3]),
                 format=entity_obj.get("format", "label"),
                 description=entity_obj.get("description", ""),
             )
-        return result
+            for entity_name, entity_obj in self._schema.objects.entities.items()
+        }
+
+    @cached_property
+    def _datatypes(self) -> tuple[str, ...]:
+        """Datatype names, read from the schema once."""
+        return tuple(self._schema.objects.datatypes.keys())
+
+    @cached_property
+    def _suffixes(self) -> dict[str, SuffixInfo]:
+        """Suffix definitions, read from the schema once."""
+        return {
+            suffix_name: SuffixInfo(
+                name=suffix_name,
+                display_name=suffix_obj.get("display_name", suffix_name),
+                description=suffix_obj.get("description", ""),
+            )
+            for suffix_name, suffix_obj in self._schema.objects.suffixes.items()
+        }
+
+    def get_entities(self) -> dict[str, EntityInfo]:
+        """Return all entity definitions."""
+        return dict(self._entities)
 
     def get_entity_short_key(self, entity_name: str) -> str:
         """Get the short key for an entity (e.g., 'subject' -> 'sub')."""
-        entities = self._schema.objects.entities
-        if entity_name in entities:
-            return entities[entity_name].get("name", entity_name[:3])
-        return entity_name[:3]
+        return self._entity_short_keys.get(entity_name, entity_name[:3])
 
     def get_datatypes(self) -> list[str]:
         """Return all valid datatype names."""
-        return list(self._schema.objects.datatypes.keys())
+        return list(self._datatypes)
 
     def get_suffixes(self) -> dict[str, SuffixInfo]:
         """Return all suffix definitions."""
-        result = {}
-        for suffix_name, suffix_obj in self._schema.objects.suffixes.items():
-            result[suffix_name] = SuffixInfo(
-                name=suffix_name,
-                display_name=suffix_obj.get("display_name", suffix_name),
-                description=suffix_obj.get("description", ""),
-            )
-        return result
+        return dict(self._suffixes)
+
+    def _get_suffixes_for_datatype(self, datatype: str) -> tuple[str, ...]:
+        """Return the sorted suffixes of a datatype, read from the schema once."""
+        suffixes = self._suffixes_for_datatype.get(datatype)
+        if suffixes is None:
+            found = set()
+            for rule in self._get_file_rules(datatype).values():
+                found.update(rule.suffixes)
+            suffixes = self._suffixes_for_datatype[datatype] = tuple(sorted(found))
+        return suffixes
 
     def get_suffixes_for_datatype(self, datatype: str) -> list[str]:
         """Return all valid suffixes for a datatype."""
-        suffixes = set()
-        try:
-            datatype_rules = self._schema.rules.files.raw.get(datatype, {})
-            for rule_name, rule in datatype_rules.items():
-                if hasattr(rule, "get"):
-                    rule_suffixes = rule.get("suffixes", [])
-                    suffixes.update(rule_suffixes)
-        except (AttributeError, KeyError):
-            pass
-        return sorted(suffixes)
+        return list(self._get_suffixes_for_datatype(datatype))
 
-    def get_file_rules(self, datatype: str) -> dict[str, FileRule]:
-        """Return all file rules for a datatype."""
+    def _get_file_rules(self, datatype: str) -> dict[str, FileRule]:
+        """Return the file rules of a datatype, read from the schema once."""
+        rules = self._file_rules.get(datatype)
+        if rules is None:
+            rules = self._file_rules[datatype] = self._read_file_rules(datatype)
+        return rules
+
+    def _read_file_rules(self, datatype: str) -> dict[str, FileRule]:
+        """Build the file rules of a datatype from the schema."""
         result = {}
         try:
             datatype_rules = self._schema.rules.files.raw.get(datatype, {})
@@ -147,6 +224,23 @@ class BIDSSchemaAdapter:
             pass
         return result
 
+    def get_file_rules(self, datatype: str) -> dict[str, FileRule]:
+        """Return all file rules for a datatype."""
+        return dict(self._get_file_rules(datatype))
+
+    def _get_entities_for_suffix(self, datatype: str, suffix: str) -> dict[str, str]:
+        """Return the entity requirements of a datatype/suffix, looked up once."""
+        key = (datatype, suffix)
+        entities = self._entities_for_suffix.get(key)
+        if entities is None:
+            entities = {}
+            for rule in self._get_file_rules(datatype).values():
+                if suffix in rule.suffixes:
+                    entities = rule.entities
+                    break
+            self._entities_for_suffix[key] = entities
+        return entities
+
     def get_entities_for_suffix(
         self, datatype: str, suffix: str
     ) -> dict[str, str]:
@@ -156,27 +250,29 @@ class BIDSSchemaAdapter:
         Returns dict mapping entity names to requirement level
         ("required" or "optional").
         """
-        rules = self.get_file_rules(datatype)
-        for rule in rules.values():
-            if suffix in rule.suffixes:
-                return rule.entities
-        return {}
+        return dict(self._get_entities_for_suffix(datatype, suffix))
+
+    def _get_entities_at_level(
+        self, datatype: str, suffix: str, level: str
+    ) -> tuple[str, ...]:
+        """Return the entities of a level for a datatype/suffix in schema order, once."""
+        key = (datatype, suffix, level)
+        names = self._entities_at_level.get(key)
+        if names is None:
+            names = self._entities_at_level[key] = tuple(
+                name
+                for name, entity_level in self._get_entities_for_suffix(datatype, suffix).items()
+                if entity_level == level and name not in ("subject", "session")
+            )
+        return names
 
     def get_required_entities(self, datatype: str, suffix: str) -> list[str]:
         """Return required entities for a datatype/suffix combination."""
-        entities = self.get_entities_for_suffix(datatype, suffix)
-        return [
-            name for name, level in entities.items()
-            if level == "required" and name not in ("subject", "session")
-        ]
+        return list(self._get_entities_at_level(datatype, suffix, "required"))
 
     def get_optional_entities(self, datatype: str, suffix: str) -> list[str]:
         """Return optional entities for a datatype/suffix combination."""
-        entities = self.get_entities_for_suffix(datatype, suffix)
-        return [
-            name for name, level in entities.items()
-            if level == "optional" and name not in ("subject", "session")
-        ]
+        return list(self._get_entities_at_level(datatype, suffix, "optional"))
 
     def is_valid_suffix_for_datatype(
         self, datatype: str, suffix: str
@@ -186,7 +282,7 @@ class BIDSSchemaAdapter:
 
         Returns (is_valid, error_message_if_invalid).
         """
-        valid_suffixes = self.get_suffixes_for_datatype(datatype)
+        valid_suffixes = self._get_suffixes_for_datatype(datatype)
         if not valid_suffixes:
             return False, f"Unknown datatype: {datatype}"
         if suffix not in valid_suffixes:
@@ -213,13 +309,13 @@ class BIDSSchemaAdapter:
             return False, errors
 
         # Check required entities
-        required = self.get_required_entities(datatype, suffix)
+        required = self._get_entities_at_level(datatype, suffix, "required")
         for entity in required:
             if entity not in entities:
                 errors.append(f"Missing required entity: {entity}")
 
         # Check entities are valid for this suffix
-        valid_entities = self.get_entities_for_suffix(datatype, suffix)
+        valid_entities = self._get_entities_for_suffix(datatype, suffix)
         for entity in entities:
             if entity not in valid_entities and entity not in ("subject", "session"):
                 errors.append(f"Entity '{entity}' not valid for {datatype}/{suffix}")
@@ -54,7 +54,10 @@ def get_schema_adapter(version: str | None = None) -> BIDSSchemaAdapter:
 
 def clear_schema_cache() -> None:
     """Clear the schema cache. Useful for testing or version switching."""
+    from ezbids_cli.schema._validation import clear_validation_cache
+
     get_schema_adapter.cache_clear()
+    clear_validation_cache()
 
 
 def preload_schema() -> None:
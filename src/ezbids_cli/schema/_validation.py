@@ -4,8 +4,43 @@ This module provides validation functions to check that datatype/suffix/entity
 combinations are valid according to the BIDS specification.
 """
 
+from functools import lru_cache
+
+from ezbids_cli.schema._bst_adapter import BIDSSchemaAdapter
 from ezbids_cli.schema._cache import get_schema_adapter
 
+# The default adapter, bound on first use and reset by clear_validation_cache.
+# Validators read it as ``_adapter or _bind_adapter()``, which is cheaper per
+# call than going through get_schema_adapter's cache.
+_adapter: BIDSSchemaAdapter | None = None
+
+
+def _bind_adapter() -> BIDSSchemaAdapter:
+    """Bind the default schema adapter to this module and return it."""
+    global _adapter
+    _adapter = get_schema_adapter()
+    return _adapter
+
+
+# Keyed on the adapter so a schema version switch never serves results from
+# another schema. Only the entity names take part in validation, so the
+# values are left out of the key; their order is kept, as errors follow it.
+@lru_cache(maxsize=1024)
+def _combination_errors(
+    adapter: BIDSSchemaAdapter, datatype: str, suffix: str, entity_names: tuple[str, ...]
+) -> tuple[str, ...]:
+    is_valid, errors = adapter.is_valid_combination(
+        datatype, suffix, dict.fromkeys(entity_names, "")
+    )
+    return tuple(errors)
+
+
+def clear_validation_cache() -> None:
+    """Clear the memoized entity validation lookups and the bound adapter."""
+    global _adapter
+    _adapter = None
+    _combination_errors.cache_clear()
+
 
 def validate_suffix_for_datatype(
     datatype: str, suffix: str
@@ -25,7 +60,7 @@ def validate_suffix_for_datatype(
     tuple[bool, str | None]
         (is_valid, error_message_if_invalid)
     """
-    adapter = get_schema_adapter()
+    adapter = _adapter or _bind_adapter()
     return adapter.is_valid_suffix_for_datatype(datatype, suffix)
 
 
@@ -49,9 +84,8 @@ def validate_entities_for_file(
     list[str]
         List of validation errors (empty if valid)
     """
-    adapter = get_schema_adapter()
-    is_valid, errors = adapter.is_valid_combination(datatype, suffix, entities)
-    return errors
+    adapter = _adapter or _bind_adapter()
+    return list(_combination_errors(adapter, datatype, suffix, tuple(entities)))
 
 
 def get_required_entities(datatype: str, suffix: str) -> list[str]:
@@ -70,7 +104,7 @@ def get_required_entities(datatype: str, suffix: str) -> list[str]:
     list[str]
         List of required entity names (excluding subject/session)
     """
-    adapter = get_schema_adapter()
+    adapter = _adapter or _bind_adapter()
     return adapter.get_required_entities(datatype, suffix)
 
 
@@ -90,7 +124,7 @@ def get_optional_entities(datatype: str, suffix: str) -> list[str]:
     list[str]
         List of optional entity names
     """
-    adapter = get_schema_adapter()
+    adapter = _adapter or _bind_adapter()
     return adapter.get_optional_entities(datatype, suffix)
 
 
@@ -108,7 +142,7 @@ def get_valid_suffixes(datatype: str) -> list[str]:
     list[str]
         List of valid suffix names
     """
-    adapter = get_schema_adapter()
+    adapter = _adapter or _bind_adapter()
     return adapter.get_suffixes_for_datatype(datatype)
 
 
@@ -121,7 +155,7 @@ def get_valid_datatypes() -> list[str]:
     list[str]
         List of valid datatype names
     """
-    adapter = get_schema_adapter()
+    adapter = _adapter or _bind_adapter()
     return adapter.get_datatypes()
 
 
@@ -147,6 +181,5 @@ def validate_file_naming(
     list[str]
         List of validation errors (empty if valid)
     """
-    adapter = get_schema_adapter()
-    is_valid, errors = adapter.is_valid_combination(datatype, suffix, entities)
-    return errors
+    adapter = _adapter or _bind_adapter()
+    return list(_combination_errors(adapter, datatype, suffix, tuple(entities)))
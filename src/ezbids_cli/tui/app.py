@@ -4,13 +4,13 @@ This module provides a terminal user interface for reviewing and editing
 BIDS mappings.
 """
 
-import json
 from pathlib import Path
 from typing import Optional
 
-from rich.console import Console
+from ezbids_cli._console import get_console
+from ezbids_cli._json import load_json
 
-console = Console()
+console = get_console()
 
 
 class EzbidsTUI:
@@ -40,8 +40,7 @@ class EzbidsTUI:
         self.data: dict = {}
 
         # Load analysis data
-        with open(analysis_file) as f:
-            self.data = json.load(f)
+        self.data = load_json(analysis_file)
 
     def run(self) -> None:
         """Run the TUI application."""
@@ -73,9 +72,12 @@ class EzbidsTUI:
         """Show series mappings."""
         series_list = self.data.get("series", [])
 
-        console.print("[bold]Series Mappings[/]")
-        console.print()
+        from rich.markup import escape
 
+        # One print for the whole listing keeps rich's per-call overhead
+        # independent of the number of series. Values from the analysis file
+        # are escaped, so a stray bracket cannot restyle the rest of it.
+        lines = ["[bold]Series Mappings[/]", ""]
         for idx, series in enumerate(series_list):
             series_desc = series.get("SeriesDescription", "Unknown")
             datatype = series.get("datatype", "?")
@@ -87,11 +89,13 @@ class EzbidsTUI:
             if series_type == "exclude":
                 status = "[red]EXCLUDED[/]"
             elif datatype and suffix:
-                status = f"[green]{datatype}/{suffix}[/]"
+                status = f"[green]{escape(f'{datatype}/{suffix}')}[/]"
             else:
                 status = "[yellow]UNIDENTIFIED[/]"
 
-            console.print(f"  {idx + 1:2d}. {series_desc[:40]:<40s} {status}")
-            console.print(f"      Volumes: {num_volumes}, Count: {count}")
+            label = escape(f"{series_desc[:40]:<40s}")
+            lines.append(f"  {idx + 1:2d}. {label} {status}")
+            lines.append(f"      Volumes: {num_volumes}, Count: {count}")
 
-        console.print()
+        lines.append("")
+        console.print("\n".join(lines))
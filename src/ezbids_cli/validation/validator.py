@@ -1,17 +1,39 @@
 """BIDS validation module for ezBIDS CLI.
 
-This module uses the bids-validator Python package to check BIDS compliance.
+This module checks BIDS compliance against the filename rules in bidsschematools,
+the same rules the bids-validator Python package applies.
 """
 
+import multiprocessing
+import os
+import re
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
+from typing import Optional
 
-from rich.console import Console
+from ezbids_cli._console import get_console
+from ezbids_cli._json import load_json
 
-console = Console()
+console = get_console()
 
 
-@dataclass
+# Below this many files, worker process startup costs more than it saves.
+# Measured with the precompiled rules at 35-45 us per check: a worker
+# starts in about 6 ms with fork, but about 85 ms with forkserver and
+# 140 ms with spawn, which re-import the package. With two workers that
+# puts break-even near 350 files with fork and 5000-8000 otherwise.
+_PARALLEL_MIN_FILES = 1000
+_PARALLEL_MIN_FILES_SPAWN = 10000
+
+# Invalid filenames listed individually; the rest are only counted
+_MAX_REPORTED_INVALID = 20
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of BIDS validation."""
 
@@ -21,9 +43,123 @@ class ValidationResult:
     files_checked: int = 0
 
 
-def validate_dataset(bids_dir: Path, verbose: bool = False) -> ValidationResult:
+def _iter_bids_files(root: str) -> Iterator[os.DirEntry]:
+    """
+    Yield the files under root, skipping hidden files and directories.
+
+    Hidden directories (work directories, version control) are pruned
+    without being entered. Symlinked files are included, symlinked
+    directories are not followed, and unreadable directories are skipped.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = [entry for entry in it if not entry.name.startswith(".")]
+    except OSError:
+        return
+
+    subdirs = []
+    for entry in entries:
+        try:
+            is_file = entry.is_file()
+            if not is_file and entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+        except OSError:
+            continue
+        if is_file:
+            yield entry
+
+    for subdir in subdirs:
+        yield from _iter_bids_files(subdir)
+
+
+@lru_cache(maxsize=1)
+def _schema_tools_available() -> bool:
     """
-    Validate a BIDS dataset using the bids-validator Python package.
+    Check once per process whether bidsschematools, which supplies the rules, is installed.
+
+    A failed import is not cached by Python and searches sys.path again
+    on every attempt; call ``_schema_tools_available.cache_clear()`` after
+    installing the package in a running process.
+    """
+    try:
+        import bidsschematools  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=1)
+def _bids_path_patterns() -> tuple[re.Pattern, ...]:
+    """
+    Compile the BIDS filename rules that ``BIDSValidator.is_bids`` checks, once.
+
+    The validator passes each rule to ``re.match`` as a string, paying a
+    pattern cache lookup per rule and path. A single alternation of all
+    rules is slower still, as the rules carry thousands of named groups
+    between them, so the rules stay separate, in the same order.
+    """
+    import logging
+
+    from bidsschematools import rules as bst_rules
+    from bidsschematools import schema as bst_schema
+    from bidsschematools import utils as bst_utils
+
+    # Quiet the schema loader's info messages, as BIDSValidator does
+    logger = bst_utils.get_logger()
+    old_level = logger.level
+    logger.setLevel(logging.WARNING)
+    try:
+        schema = bst_schema.load_schema()
+    finally:
+        logger.setLevel(old_level)
+    rules = chain.from_iterable(
+        bst_rules.regexify_filename_rules(group, schema, level=2)
+        for group in (schema.rules.files.common, schema.rules.files.raw)
+    )
+    return tuple(re.compile(rule["regex"]) for rule in rules)
+
+
+def _is_bids_path(rel_path: str) -> bool:
+    """
+    Check one dataset-relative path with a leading slash, as ``BIDSValidator.is_bids`` does.
+
+    Also runs in worker processes, which compile the rules once each.
+    """
+    if rel_path.startswith(os.sep):
+        rel_path = rel_path.replace(os.sep, "/")
+    if not rel_path.startswith("/"):
+        return False
+
+    # The first matching rule decides, and only accepts the path if it
+    # captures something
+    path = rel_path[1:]
+    for pattern in _bids_path_patterns():
+        match = pattern.match(path)
+        if match:
+            return any(value is not None for value in match.groupdict().values())
+    return False
+
+
+def _report_invalid_files(result: ValidationResult, invalid_files: Iterable[str]) -> None:
+    """Add errors for the first invalid files and a count of the rest, without storing them."""
+    count = 0
+    for rel_path in invalid_files:
+        if count < _MAX_REPORTED_INVALID:
+            result.errors.append(f"Invalid BIDS filename: {rel_path}")
+        count += 1
+    if count > _MAX_REPORTED_INVALID:
+        result.errors.append(f"... and {count - _MAX_REPORTED_INVALID} more invalid files")
+
+
+def validate_dataset(
+    bids_dir: Path,
+    verbose: bool = False,
+    jobs: Optional[int] = None,
+    fast_fail: bool = True,
+    only_valid: bool = False,
+) -> ValidationResult:
+    """
+    Validate a BIDS dataset against the BIDS schema filename rules.
 
     Parameters
     ----------
@@ -31,22 +167,30 @@ def validate_dataset(bids_dir: Path, verbose: bool = False) -> ValidationResult:
         Path to BIDS dataset root
     verbose : bool
         Print detailed output
+    jobs : int, optional
+        Number of worker processes used for large datasets (default: number of CPUs)
+    fast_fail : bool
+        Return without checking every filename when the top-level files
+        already make the dataset invalid (ignored when verbose)
+    only_valid : bool
+        Stop at the first invalid filename, for callers that only need
+        ``valid``; at most one filename error is reported
 
     Returns
     -------
     ValidationResult
         Validation result with errors and warnings
     """
-    try:
-        from bids_validator import BIDSValidator
-    except ImportError:
+    if not _schema_tools_available():
         return ValidationResult(
             valid=False,
-            errors=["bids-validator package not installed. Install with: pip install bids-validator"],
+            errors=[
+                "bidsschematools package not installed. "
+                "Install with: pip install bidsschematools"
+            ],
         )
 
     result = ValidationResult()
-    validator = BIDSValidator()
 
     # Walk the dataset and validate each file
     bids_dir = Path(bids_dir)
@@ -59,27 +203,53 @@ def validate_dataset(bids_dir: Path, verbose: bool = False) -> ValidationResult:
     dataset_description = bids_dir / "dataset_description.json"
     if not dataset_description.exists():
         result.errors.append("Missing required file: dataset_description.json")
+    else:
+        try:
+            load_json(dataset_description)
+        except (OSError, ValueError) as e:
+            result.errors.append(f"Malformed dataset_description.json: {e}")
 
-    # Validate all files in the dataset
-    invalid_files = []
-    for file_path in bids_dir.rglob("*"):
-        if file_path.is_file():
-            # Skip hidden files and work directories
-            if any(part.startswith(".") for part in file_path.parts):
-                continue
-
-            # Get path relative to BIDS root with leading slash
-            rel_path = "/" + str(file_path.relative_to(bids_dir))
+    # The dataset is invalid whatever its filenames are
+    if result.errors and fast_fail and not verbose:
+        result.valid = False
+        return result
 
+    # Validate all files in the dataset, by paths relative to the BIDS root
+    # with a leading slash
+    root = str(bids_dir)
+    if only_valid:
+        for entry in _iter_bids_files(root):
+            rel_path = "/" + entry.path[len(root) + 1:]
             result.files_checked += 1
+            if not _is_bids_path(rel_path):
+                result.errors.append(f"Invalid BIDS filename: {rel_path}")
+                break
+        result.valid = len(result.errors) == 0
+        return result
 
-            if not validator.is_bids(rel_path):
-                invalid_files.append(rel_path)
+    rel_paths = ["/" + entry.path[len(root) + 1:] for entry in _iter_bids_files(root)]
+    result.files_checked = len(rel_paths)
 
-    if invalid_files:
-        result.errors.extend([f"Invalid BIDS filename: {f}" for f in invalid_files[:20]])
-        if len(invalid_files) > 20:
-            result.errors.append(f"... and {len(invalid_files) - 20} more invalid files")
+    # Each check holds the GIL, so large datasets are spread over processes
+    # rather than threads
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    # Results are consumed as they arrive; failing paths beyond the reported
+    # ones are only counted
+    if multiprocessing.get_start_method() == "fork":
+        min_files = _PARALLEL_MIN_FILES
+    else:
+        min_files = _PARALLEL_MIN_FILES_SPAWN
+    if jobs > 1 and len(rel_paths) >= min_files:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            checks = executor.map(_is_bids_path, rel_paths, chunksize=512)
+            _report_invalid_files(
+                result, (rel_path for rel_path, ok in zip(rel_paths, checks) if not ok)
+            )
+    else:
+        _report_invalid_files(
+            result, (rel_path for rel_path in rel_paths if not _is_bids_path(rel_path))
+        )
 
     result.valid = len(result.errors) == 0
 
@@ -88,14 +258,18 @@ def validate_dataset(bids_dir: Path, verbose: bool = False) -> ValidationResult:
 
 def print_validation_result(result: ValidationResult, verbose: bool = False) -> None:
     """Print validation results to console."""
+    from rich.markup import escape
+
     if result.valid:
         console.print(f"[green]✓ Dataset is BIDS valid![/] ({result.files_checked} files checked)")
     else:
-        console.print(f"[red]✗ Validation errors found[/] ({result.files_checked} files checked)")
-        for error in result.errors:
-            console.print(f"  [red]• {error}[/]")
+        # One print per block; messages quote filenames, which may contain
+        # brackets, so they are escaped rather than parsed as markup
+        lines = [f"[red]✗ Validation errors found[/] ({result.files_checked} files checked)"]
+        lines.extend(f"  [red]• {escape(error)}[/]" for error in result.errors)
+        console.print("\n".join(lines))
 
     if verbose and result.warnings:
-        console.print("[yellow]Warnings:[/]")
-        for warning in result.warnings:
-            console.print(f"  [yellow]• {warning}[/]")
+        lines = ["[yellow]Warnings:[/]"]
+        lines.extend(f"  [yellow]• {escape(warning)}[/]" for warning in result.warnings)
+        console.print("\n".join(lines))
@@ -0,0 +1,29 @@
+"""Tests for the analysis orchestration."""
+
+from click.testing import CliRunner
+
+from ezbids_cli.cli import main
+from ezbids_cli.core import analyzer as analyzer_module
+
+
+def test_jobs_reach_dataset_list(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_generate(data_dir, file_list, scan=None, jobs=None):
+        calls.append(jobs)
+        return []
+
+    monkeypatch.setattr(analyzer_module, "preprocess_input", lambda d, o, verbose: (d, False))
+    monkeypatch.setattr(
+        analyzer_module,
+        "scan_directory",
+        lambda d: {".nii.gz": [str(d / "a.nii.gz")], ".nii": []},
+    )
+    monkeypatch.setattr(analyzer_module, "generate_dataset_list", fake_generate)
+
+    result = CliRunner().invoke(
+        main, ["analyze", str(tmp_path), "-o", str(tmp_path / "out"), "-j", "3"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert calls == [3]
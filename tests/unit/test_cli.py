@@ -0,0 +1,40 @@
+"""Tests for the lazy CLI command group."""
+
+import subprocess
+import sys
+
+import pytest
+
+from ezbids_cli.cli import LazyGroup, main
+
+
+@pytest.mark.parametrize("name", sorted(LazyGroup.COMMANDS))
+def test_short_help_matches_command(name):
+    command = main.get_command(None, name)
+    assert command is not None
+    assert command.get_short_help_str(limit=200) == LazyGroup.SHORT_HELP[name]
+
+
+def test_help_does_not_import_commands():
+    code = (
+        "import sys\n"
+        "from ezbids_cli.cli import main\n"
+        "try:\n"
+        "    main(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "loaded = [m for m in sys.modules if m.startswith('ezbids_cli.cli_cmds.')]\n"
+        "print(','.join(loaded) or 'none')\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert proc.stdout.strip().splitlines()[-1] == "none"
+
+
+def test_unknown_command():
+    assert main.get_command(None, "nope") is None
+
+
+def test_target_that_is_not_a_command(monkeypatch):
+    monkeypatch.setitem(LazyGroup.COMMANDS, "version", "ezbids_cli:__version__")
+    with pytest.raises(TypeError, match="not a click command"):
+        main.get_command(None, "version")
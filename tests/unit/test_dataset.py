@@ -0,0 +1,46 @@
+"""Tests for dataset organization."""
+
+import random
+
+from ezbids_cli.core.dataset import organize_dataset
+from ezbids_cli.core.models import Acquisition
+
+
+def _acquisitions():
+    acquisitions = []
+    for patient, date in (("p1", "2024-01-01"), ("p2", "2024-01-01"), ("p1", "2024-02-01")):
+        for series in range(3):
+            acquisitions.append(
+                Acquisition(
+                    nifti_path=f"/data/{patient}_{date}_{series}.nii.gz",
+                    json_path=f"/data/{patient}_{date}_{series}.json",
+                    patient_id=patient,
+                    acquisition_date=date,
+                    acquisition_time=f"10:0{series}:00.000000",
+                    modified_series_number=f"{series:02d}",
+                )
+            )
+    return acquisitions
+
+
+def _indices(acquisitions):
+    return sorted((str(a.nifti_path), a.subject_idx, a.session_idx) for a in acquisitions)
+
+
+def test_organize_sorts_its_input():
+    expected = _indices(organize_dataset(_acquisitions()))
+
+    shuffled = _acquisitions()
+    random.Random(0).shuffle(shuffled)
+
+    assert _indices(organize_dataset(shuffled)) == expected
+
+
+def test_subject_and_session_indices():
+    organized = organize_dataset(_acquisitions())
+
+    assert [(a.patient_id, a.subject_idx, a.session_idx) for a in organized[::3]] == [
+        ("p1", 1, 1),
+        ("p2", 2, 1),
+        ("p1", 3, 1),
+    ]
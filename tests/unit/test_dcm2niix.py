@@ -0,0 +1,72 @@
+"""Tests for dcm2niix input probing."""
+
+import os
+
+import pytest
+
+from ezbids_cli.preprocess import dcm2niix
+from ezbids_cli.preprocess.dcm2niix import _has_dicom_entry, is_dicom_directory
+
+
+def _write_dicom(path):
+    path.write_bytes(b"\0" * 128 + b"DICM" + b"\0" * 16)
+
+
+def _write_other(path):
+    path.write_bytes(b"\0" * 256)
+
+
+def _sorted_entries(path):
+    with os.scandir(path) as it:
+        return sorted(it, key=lambda entry: entry.name)
+
+
+def test_dicom_extension(tmp_path):
+    (tmp_path / "series").mkdir()
+    (tmp_path / "series" / "IM0001.DCM").touch()
+
+    assert is_dicom_directory(tmp_path, jobs=1)
+
+
+def test_later_suffixless_file_is_probed(tmp_path):
+    for i in range(3):
+        _write_other(tmp_path / f"a{i}")
+    _write_dicom(tmp_path / "b0")
+
+    assert _has_dicom_entry(_sorted_entries(tmp_path))
+    assert is_dicom_directory(tmp_path, jobs=1)
+
+
+def test_probes_are_capped_per_tree(tmp_path):
+    for i in range(dcm2niix._MAX_MAGIC_PROBES):
+        _write_other(tmp_path / f"a{i:03d}")
+    _write_dicom(tmp_path / "b0")
+
+    assert not _has_dicom_entry(_sorted_entries(tmp_path))
+
+
+def test_files_with_suffix_are_not_probed(tmp_path):
+    _write_dicom(tmp_path / "scan.bin")
+    _write_other(tmp_path / "notes")
+
+    assert not is_dicom_directory(tmp_path, jobs=1)
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_each_subdirectory_gets_its_own_probes(tmp_path, jobs):
+    for name in ("s1", "s2", "s3"):
+        (tmp_path / name).mkdir()
+    for i in range(dcm2niix._MAX_MAGIC_PROBES):
+        _write_other(tmp_path / "s1" / f"a{i:03d}")
+    (tmp_path / "s3" / "nested").mkdir()
+    _write_dicom(tmp_path / "s3" / "nested" / "IM1")
+
+    assert is_dicom_directory(tmp_path, jobs=jobs)
+
+
+def test_no_dicom(tmp_path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "scan.nii.gz").touch()
+    _write_other(tmp_path / "sub" / "README")
+
+    assert not is_dicom_directory(tmp_path, jobs=1)
@@ -0,0 +1,68 @@
+"""Tests for the JSON helpers."""
+
+import json
+
+import pytest
+
+from ezbids_cli import _json
+from ezbids_cli._json import dumps_json, load_json, stream_json
+
+DOCUMENTS = [
+    pytest.param({}, id="empty"),
+    pytest.param({"a": 1, "b": "two", "c": None, "d": True, "e": 1.5}, id="scalars"),
+    pytest.param({"items": []}, id="empty-list"),
+    pytest.param({"items": [1, 2, 3], "more": ["x"]}, id="flat-lists"),
+    pytest.param(
+        {
+            "objects": [{"name": "a", "paths": ["x", "y"], "meta": {"k": [1, {"z": []}]}}, {}],
+            "nested": {"inner": {"list": [1, 2], "empty": {}}},
+        },
+        id="nested",
+    ),
+    pytest.param({"text": 'tab\tnew\nline "quoted" ünïcödé'}, id="escapes"),
+]
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run a test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(_json, "orjson", None)
+    elif _json.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_stream_json_matches_dumps(tmp_path, backend, document):
+    path = tmp_path / "out.json"
+    stream_json(document, path)
+
+    assert path.read_bytes() == dumps_json(document)
+    assert json.loads(path.read_bytes()) == document
+    if backend == "stdlib":
+        assert path.read_text(encoding="utf-8") == json.dumps(document, indent=2)
+
+
+def test_stream_json_writes_iterators_as_arrays(tmp_path, backend):
+    path = tmp_path / "out.json"
+    stream_json({"items": iter([{"a": 1}, {"b": [2]}]), "none": iter(())}, path)
+
+    expected = {"items": [{"a": 1}, {"b": [2]}], "none": []}
+    assert path.read_bytes() == dumps_json(expected)
+
+
+def test_load_json_round_trip(tmp_path, backend):
+    path = tmp_path / "out.json"
+    document = {"a": [1, 2, {"b": "c"}]}
+    path.write_bytes(dumps_json(document))
+
+    assert load_json(path) == document
+
+
+def test_load_json_rejects_malformed(tmp_path, backend):
+    path = tmp_path / "bad.json"
+    path.write_text("{bad")
+
+    with pytest.raises(ValueError):
+        load_json(path)
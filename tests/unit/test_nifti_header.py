@@ -0,0 +1,44 @@
+"""Tests for the single-block NIfTI header reader."""
+
+import os
+
+import nibabel as nib
+import numpy as np
+import pytest
+
+from ezbids_cli.core.dataset import _read_nifti_header
+
+CASES = [
+    pytest.param(nib.Nifti1Image, "<", id="nifti1-little"),
+    pytest.param(nib.Nifti1Image, ">", id="nifti1-big"),
+    pytest.param(nib.Nifti2Image, "<", id="nifti2-little"),
+    pytest.param(nib.Nifti2Image, ">", id="nifti2-big"),
+]
+
+
+def _write_image(path, image_class, endianness):
+    header = image_class.header_class(endianness=endianness)
+    data = np.arange(4 * 5 * 6 * 3, dtype=f"{endianness}i2").reshape(4, 5, 6, 3)
+    affine = np.diag([2.0, 2.5, 3.0, 1.0])
+    image = image_class(data, affine, header=header)
+    image.header.set_xyzt_units("mm", "sec")
+    image.header["pixdim"][4] = 1.5
+    nib.save(image, path)
+
+
+@pytest.mark.parametrize("suffix", [".nii", ".nii.gz"])
+@pytest.mark.parametrize("image_class, endianness", CASES)
+def test_header_matches_nibabel(tmp_path, image_class, endianness, suffix):
+    path = str(tmp_path / f"image{suffix}")
+    _write_image(path, image_class, endianness)
+
+    header, filesize = _read_nifti_header(path)
+    expected = nib.load(path).header
+
+    assert type(header) is type(expected)
+    assert header.endianness == expected.endianness == endianness
+    assert header.get_data_shape() == expected.get_data_shape() == (4, 5, 6, 3)
+    assert header.get_zooms() == expected.get_zooms()
+    assert header.get_data_dtype() == expected.get_data_dtype()
+    np.testing.assert_array_equal(header.get_best_affine(), expected.get_best_affine())
+    assert filesize == os.path.getsize(path)
@@ -0,0 +1,180 @@
+"""Tests for BIDS dataset validation."""
+
+import itertools
+import json
+
+import pytest
+
+from ezbids_cli.validation import validator
+from ezbids_cli.validation.validator import _is_bids_path, validate_dataset
+
+bids_validator = pytest.importorskip("bids_validator")
+
+TOP_LEVEL = [
+    "/dataset_description.json",
+    "/README",
+    "/README.md",
+    "/CHANGES",
+    "/LICENSE",
+    "/participants.tsv",
+    "/participants.json",
+    "/task-rest_bold.json",
+    "/scans.tsv",
+    "/readme.txt",
+    "/dataset_description.JSON",
+    "/.bidsignore",
+]
+
+ASSOCIATED = [
+    "/code/convert.py",
+    "/derivatives/fmriprep/sub-01/anat/sub-01_desc-preproc_T1w.nii.gz",
+    "/sourcedata/sub-01/dicom/IM0001",
+    "/stimuli/face.png",
+    "/derivative/x.txt",
+]
+
+FILES = [
+    "anat/{sub}{ses}_T1w.nii.gz",
+    "anat/{sub}{ses}_T1w.json",
+    "anat/{sub}{ses}_acq-mprage_run-01_T2w.nii",
+    "anat/{sub}{ses}_T1W.nii.gz",
+    "anat/{sub}{ses}_run-1_T1w.nii.gz",
+    "anat/{sub}{ses}_run-a_T1w.nii.gz",
+    "func/{sub}{ses}_task-rest_bold.nii.gz",
+    "func/{sub}{ses}_task-rest_run-01_echo-2_bold.json",
+    "func/{sub}{ses}_task-rest_sbref.nii.gz",
+    "func/{sub}{ses}_task-n-back_bold.nii.gz",
+    "func/{sub}{ses}_bold.nii.gz",
+    "func/{sub}{ses}_task-rest_events.tsv",
+    "dwi/{sub}{ses}_dwi.nii.gz",
+    "dwi/{sub}{ses}_dir-AP_dwi.bval",
+    "dwi/{sub}{ses}_dir-AP_dwi.bvec",
+    "dwi/{sub}{ses}_dwi.txt",
+    "fmap/{sub}{ses}_dir-PA_epi.nii.gz",
+    "fmap/{sub}{ses}_magnitude1.nii.gz",
+    "fmap/{sub}{ses}_phasediff.json",
+    "fmap/{sub}{ses}_fieldmap.nii.gz",
+    "perf/{sub}{ses}_asl.nii.gz",
+    "anat/{sub}_ses-02_T1w.nii.gz",
+    "junk/{sub}{ses}_T1w.nii.gz",
+    "{sub}{ses}_scans.tsv",
+    "anat/{sub}{ses}_T1w.nii.gz.bak",
+]
+
+
+def _corpus():
+    paths = TOP_LEVEL + ASSOCIATED
+    for sub, ses, template in itertools.product(("sub-01", "sub-ABC"), ("", "_ses-01"), FILES):
+        session_dir = "/ses-01" if ses else ""
+        paths.append(f"/{sub}{session_dir}/" + template.format(sub=sub, ses=ses))
+    paths.append("sub-01/anat/sub-01_T1w.nii.gz")  # no leading slash
+    return paths
+
+
+@pytest.mark.parametrize("path", _corpus())
+def test_matches_bids_validator(path):
+    assert _is_bids_path(path) == bids_validator.BIDSValidator().is_bids(path)
+
+
+def test_corpus_has_both_outcomes():
+    outcomes = {_is_bids_path(path) for path in _corpus()}
+    assert outcomes == {True, False}
+
+
+def _make_dataset(root, description=True):
+    (root / "sub-01" / "anat").mkdir(parents=True)
+    (root / "sub-01" / "anat" / "sub-01_T1w.nii.gz").touch()
+    (root / "sub-01" / "anat" / "sub-01_T1w.json").write_text("{}")
+    (root / ".git").mkdir()
+    (root / ".git" / "config").touch()
+    if description:
+        (root / "dataset_description.json").write_text(
+            json.dumps({"Name": "test", "BIDSVersion": "1.9.0"})
+        )
+
+
+def test_valid_dataset(tmp_path):
+    _make_dataset(tmp_path)
+
+    result = validate_dataset(tmp_path, jobs=1)
+
+    assert result.valid
+    assert result.errors == []
+    assert result.files_checked == 3
+
+
+def test_invalid_files_are_reported_and_counted(tmp_path):
+    _make_dataset(tmp_path)
+    for i in range(25):
+        (tmp_path / f"bad{i:02d}.txt").touch()
+
+    result = validate_dataset(tmp_path, jobs=1)
+
+    assert not result.valid
+    assert len(result.errors) == 21
+    assert result.errors[-1] == "... and 5 more invalid files"
+    assert all(error.startswith("Invalid BIDS filename: /bad") for error in result.errors[:20])
+
+
+def test_missing_description_fails_fast(tmp_path):
+    _make_dataset(tmp_path, description=False)
+    (tmp_path / "bad.txt").touch()
+
+    result = validate_dataset(tmp_path)
+    assert result.errors == ["Missing required file: dataset_description.json"]
+    assert result.files_checked == 0
+
+    result = validate_dataset(tmp_path, verbose=True, jobs=1)
+    assert result.errors == [
+        "Missing required file: dataset_description.json",
+        "Invalid BIDS filename: /bad.txt",
+    ]
+
+
+def test_malformed_description(tmp_path):
+    _make_dataset(tmp_path, description=False)
+    (tmp_path / "dataset_description.json").write_text("{bad")
+
+    result = validate_dataset(tmp_path)
+
+    assert not result.valid
+    assert result.errors[0].startswith("Malformed dataset_description.json")
+
+
+def test_only_valid_stops_at_first_error(tmp_path):
+    _make_dataset(tmp_path)
+    for i in range(5):
+        (tmp_path / f"bad{i}.txt").touch()
+
+    result = validate_dataset(tmp_path, only_valid=True)
+
+    assert not result.valid
+    assert len(result.errors) == 1
+
+
+def test_parallel_check_matches_serial(tmp_path, monkeypatch):
+    _make_dataset(tmp_path)
+    for i in range(30):
+        (tmp_path / f"sub-{i:02d}" / "func").mkdir(parents=True)
+        (tmp_path / f"sub-{i:02d}" / "func" / f"sub-{i:02d}_task-rest_bold.nii.gz").touch()
+        (tmp_path / f"sub-{i:02d}" / "func" / f"sub-{i:02d}_bold.txt").touch()
+
+    pools = []
+
+    class SpyExecutor(validator.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            pools.append(kwargs.get("max_workers"))
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(validator, "ProcessPoolExecutor", SpyExecutor)
+    monkeypatch.setattr(validator, "_PARALLEL_MIN_FILES", 10)
+    monkeypatch.setattr(validator, "_PARALLEL_MIN_FILES_SPAWN", 10)
+
+    serial = validate_dataset(tmp_path, jobs=1)
+    assert pools == []
+    parallel = validate_dataset(tmp_path, jobs=2)
+    assert pools == [2]
+
+    assert parallel == serial
+    assert not serial.valid
+    assert len(serial.errors) == 21